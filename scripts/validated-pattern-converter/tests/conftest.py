@@ -10,6 +10,12 @@ import pytest
 import yaml
 
 
+@pytest.fixture(autouse=True)
+def no_analysis_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep tests from reading or writing the user's analysis caches."""
+    monkeypatch.setenv("VPCONVERTER_NO_CACHE", "1")
+
+
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """Provide a temporary directory for tests."""
@@ -9,6 +9,7 @@ import pytest
 from vpconverter.generator import PatternGenerator
 from vpconverter.analyzer import AnalysisResult, HelmChart
 from vpconverter.models import PatternData, ClusterGroupApplication, ClusterGroupSubscription
+from vpconverter.templates import MAKEFILE_TEMPLATE, VALUES_HUB_TEMPLATE
 
 
 def test_pattern_generator_initialization(temp_dir: Path):
@@ -163,6 +164,42 @@ def test_deep_merge(temp_dir: Path):
     assert result["g"] == 5
 
 
+def test_detect_labels_ordered(temp_dir: Path):
+    """Test that detected metadata labels are unique and in first-seen order."""
+    generator = PatternGenerator("test", temp_dir)
+
+    analysis_result = AnalysisResult(source_path=temp_dir)
+    analysis_result.detected_patterns = {"Data Processing"}
+    analysis_result.helm_charts = [
+        HelmChart(name="web-frontend", path=temp_dir / "web-frontend"),
+        HelmChart(name="metrics-api", path=temp_dir / "metrics-api"),
+        # Keywords match anywhere in the name, not just whole tokens
+        HelmChart(name="springboot-payments", path=temp_dir / "springboot-payments"),
+    ]
+
+    assert generator._detect_categories(analysis_result) == [
+        "gitops", "kubernetes", "data", "analytics", "web", "microservices"
+    ]
+    assert generator._detect_languages(analysis_result) == ["yaml", "helm", "java"]
+    assert generator._detect_industries(analysis_result) == [
+        "technology", "cloud-computing", "data-analytics", "business-intelligence",
+        "financial-services"
+    ]
+
+
+def test_compiled_templates_shared(temp_dir: Path):
+    """Test that compiled templates are reused across generator instances."""
+    first = PatternGenerator("first", temp_dir / "first")
+    second = PatternGenerator("second", temp_dir / "second")
+
+    for template in (MAKEFILE_TEMPLATE, VALUES_HUB_TEMPLATE):
+        compiled = first._compile_template(template)
+        assert second._compile_template(template) is compiled
+
+    # A template built at runtime with the same text hits the same entry
+    assert first._compile_template("".join(list(MAKEFILE_TEMPLATE))) is first._compile_template(MAKEFILE_TEMPLATE)
+
+
 def test_generate_clustergroup_chart(temp_dir: Path):
     """Test generation of ClusterGroup chart."""
     pattern_dir = temp_dir / "test-pattern"
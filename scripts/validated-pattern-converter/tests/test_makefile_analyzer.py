@@ -0,0 +1,93 @@
+"""
+Tests for the makefile_analyzer module.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from vpconverter import makefile_analyzer
+from vpconverter.makefile_analyzer import MakefileAnalyzer
+
+
+MAKEFILE = """\
+.PHONY: install uninstall
+CHART ?= charts/app
+
+install: deps ## Install the chart
+\thelm install app $(CHART)
+
+deps:
+\t./scripts/deps.sh
+
+uninstall:
+\thelm uninstall app
+"""
+
+
+@pytest.fixture
+def cache_dir(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Enable the parse cache in a temporary directory."""
+    cache = temp_dir / "cache"
+    monkeypatch.delenv("VPCONVERTER_NO_CACHE")
+    monkeypatch.setattr(makefile_analyzer, "MAKEFILE_CACHE_DIR", cache)
+    return cache
+
+
+def test_parse_cache_round_trip(temp_dir: Path, cache_dir: Path):
+    """A cached parse gives the same analysis as a fresh one."""
+    makefile = temp_dir / "Makefile"
+    makefile.write_text(MAKEFILE)
+
+    fresh = MakefileAnalyzer(makefile).analyze()
+    cache_files = list(cache_dir.glob("*.json"))
+    assert len(cache_files) == 1
+    json.loads(cache_files[0].read_text())
+
+    cached = MakefileAnalyzer(makefile).analyze()
+    assert cached.targets == fresh.targets
+    assert cached.variables == fresh.variables
+    assert cached.detected_tools == fresh.detected_tools
+    assert cached.install_flow == fresh.install_flow
+    assert cached.targets["install"].name_lower == "install"
+
+
+def test_parse_cache_ignores_malformed_entries(temp_dir: Path, cache_dir: Path):
+    """A corrupt cache file is reparsed and replaced."""
+    makefile = temp_dir / "Makefile"
+    makefile.write_text(MAKEFILE)
+    MakefileAnalyzer(makefile).analyze()
+    cache_file = next(cache_dir.glob("*.json"))
+    cache_file.write_text('{"targets": []}')
+
+    analysis = MakefileAnalyzer(makefile).analyze()
+    assert "install" in analysis.targets
+    assert json.loads(cache_file.read_text())["targets"]
+
+
+def test_parse_cache_prunes_stale_entries(temp_dir: Path, cache_dir: Path):
+    """Writing a cache entry removes entries unused for too long."""
+    cache_dir.mkdir()
+    stale = cache_dir / "stale.json"
+    stale.write_text("{}")
+    os.utime(stale, (0, 0))
+
+    makefile = temp_dir / "Makefile"
+    makefile.write_text(MAKEFILE)
+    MakefileAnalyzer(makefile).analyze()
+
+    assert not stale.exists()
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+
+def test_parse_cache_disabled(temp_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    """VPCONVERTER_NO_CACHE keeps the analyzer from writing a cache."""
+    cache = temp_dir / "cache"
+    monkeypatch.setattr(makefile_analyzer, "MAKEFILE_CACHE_DIR", cache)
+    makefile = temp_dir / "Makefile"
+    makefile.write_text(MAKEFILE)
+
+    MakefileAnalyzer(makefile).analyze()
+    assert not cache.exists()
@@ -6,7 +6,7 @@ configuration files, and existing pattern structures.
 """
 
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Set, Tuple, TYPE_CHECKING
 
 import yaml
 
@@ -89,6 +89,7 @@ class PatternAnalyzer:
     def _analyze_helm_charts(self, verbose: bool = False) -> None:
         """Find and analyze all Helm charts in the repository."""
         chart_files = find_files(self.source_path, CHART_FILE)
+        makefile_charts = []
 
         for chart_file in chart_files:
             chart_dir = chart_file.parent
@@ -168,43 +169,55 @@ class PatternAnalyzer:
                 except Exception as e:
                     log_warn(f"    Enhanced analysis failed: {e}")
 
-                        # Check for Makefile in chart directory and parent directories
+            # Makefiles are analyzed together once every chart is found
             if MAKEFILE_ANALYSIS_AVAILABLE:
-                # Check in chart directory first
-                makefile_path = chart_dir / "Makefile"
-
-                # If not found, check parent directories (up to 4 levels)
-                if not makefile_path.exists():
-                    parent = chart_dir.parent
-                    for _ in range(4):  # Check up to 4 parent levels
-                        parent_makefile = parent / "Makefile"
-                        if parent_makefile.exists():
-                            makefile_path = parent_makefile
-                            break
-                        parent = parent.parent
-                        if parent == parent.parent:  # Reached root
-                            break
-
-                if makefile_path.exists():
-                    try:
-                        log_info(f"    Found Makefile at: {relative_path(makefile_path, self.source_path)}")
-                        log_info(f"    Analyzing deployment process...")
-                        makefile_analyzer = MakefileAnalyzer(makefile_path)
-                        makefile_results = makefile_analyzer.analyze(verbose)
-                        chart.makefile_analysis = makefile_results
-
-                        if makefile_results.has_install_target:
-                            log_info(f"      ✓ Install process detected")
-                        if makefile_results.has_uninstall_target:
-                            log_info(f"      ✓ Uninstall process detected")
-                        if makefile_results.detected_tools:
-                            log_info(f"      Tools: {', '.join(sorted(makefile_results.detected_tools))}")
-
-                    except Exception as e:
-                        log_warn(f"    Makefile analysis failed: {e}")
+                makefile_path = self._find_makefile(chart_dir)
+                if makefile_path:
+                    makefile_charts.append((chart, makefile_path))
 
             self.result.helm_charts.append(chart)
 
+        if makefile_charts:
+            self._analyze_makefiles(makefile_charts, verbose)
+
+    @staticmethod
+    def _find_makefile(chart_dir: Path) -> Optional[Path]:
+        """Find the Makefile for a chart, in its directory or up to 4 parents."""
+        # Check in chart directory first
+        makefile_path = chart_dir / "Makefile"
+        if makefile_path.exists():
+            return makefile_path
+
+        parent = chart_dir.parent
+        for _ in range(4):  # Check up to 4 parent levels
+            parent_makefile = parent / "Makefile"
+            if parent_makefile.exists():
+                return parent_makefile
+            parent = parent.parent
+            if parent == parent.parent:  # Reached root
+                break
+        return None
+
+    def _analyze_makefiles(self, makefile_charts: List[Tuple[HelmChart, Path]], verbose: bool) -> None:
+        """Analyze the charts' Makefiles, each distinct Makefile once."""
+        paths = list(dict.fromkeys(path for _, path in makefile_charts))
+        log_info(f"  Analyzing deployment process in {len(paths)} Makefile(s)...")
+        results = dict(zip(paths, MakefileAnalyzer.analyze_many(paths, verbose)))
+
+        for chart, makefile_path in makefile_charts:
+            makefile_results = results[makefile_path]
+            if makefile_results is None:
+                continue
+            chart.makefile_analysis = makefile_results
+
+            log_info(f"    {chart.name}: Makefile at {relative_path(makefile_path, self.source_path)}")
+            if makefile_results.has_install_target:
+                log_info(f"      ✓ Install process detected")
+            if makefile_results.has_uninstall_target:
+                log_info(f"      ✓ Uninstall process detected")
+            if makefile_results.detected_tools:
+                log_info(f"      Tools: {', '.join(sorted(makefile_results.detected_tools))}")
+
     def _analyze_chart_structure(self, chart: HelmChart, verbose: bool) -> None:
         """Analyze the structure of a Helm chart."""
         # Check for values.yaml
@@ -75,6 +75,11 @@ def cli(ctx: click.Context, verbose: bool) -> None:
     is_flag=True,
     help="Clone reference pattern (multicloud-gitops) for comparison"
 )
+@click.option(
+    "--link-scripts",
+    is_flag=True,
+    help="Hardlink migrated scripts to the source instead of copying (edits affect both)"
+)
 @click.pass_context
 def convert(
     ctx: click.Context,
@@ -84,7 +89,8 @@ def convert(
     output_dir: Optional[str],
     analyze_only: bool,
     skip_validation: bool,
-    clone_reference: bool
+    clone_reference: bool,
+    link_scripts: bool
 ) -> None:
     """Convert a source repository into a validated pattern.
 
@@ -145,7 +151,7 @@ def convert(
 
         # Phase 3: Migration
         console.print("\n[bold yellow]=== Phase 3: Migration ===[/bold yellow]")
-        migrator = HelmMigrator(pattern_dir, generator)
+        migrator = HelmMigrator(pattern_dir, generator, link_scripts=link_scripts)
         charts_migrated = migrator.migrate_all(analysis_result)
         scripts_migrated = migrator.migrate_scripts(analysis_result)
 
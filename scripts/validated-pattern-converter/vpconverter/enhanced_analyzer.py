@@ -10,16 +10,59 @@ This module provides deep analysis of Helm charts including:
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, FrozenSet, Iterable, Optional, Tuple
+import hashlib
+import json
+import os
+import tempfile
 import yaml
 import re
 
-from .models import HelmChart, AnalysisResult, ArchitecturePattern
-from .utils import log_info, log_warn, console, read_yaml
-from .rules_engine import RuleEngine, PatternDefinition, DetectionRule, load_patterns
-
-
-@dataclass
+from .models import HelmChart, AnalysisResult, ArchitecturePattern, DATACLASS_SLOTS
+from .utils import (
+    log_info, log_warn, console, read_yaml, YAML_LOADER,
+    CACHE_ROOT, cache_enabled, prune_cache, touch_cache_file,
+)
+from .rules_engine import (
+    RuleEngine, PatternDefinition, DetectionRule, load_patterns,
+    compile_rule_groups, rule_group_key
+)
+
+# orjson is optional; pure-JSON manifests fall back to the YAML parser without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Go template actions ({{ ... }}) replaced before YAML parsing
+_GO_TEMPLATE_RE = re.compile(r'{{\s*[-\s]*.*?[-\s]*\s*}}')
+
+# Per-chart cache of parsed templates, keyed on file mtime and size. It lives
+# in the user cache directory so analysis never writes into the source tree.
+TEMPLATE_CACHE_DIR = CACHE_ROOT / "chart-templates"
+_CACHE_VERSION = 2
+
+# Scalar types that survive a JSON round trip unchanged
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+# Resource kinds that indicate RBAC configuration
+_RBAC_KINDS = frozenset({'Role', 'ClusterRole', 'RoleBinding', 'ClusterRoleBinding'})
+
+
+def _json_safe(value: Any) -> bool:
+    """Return True if value is plain JSON data that loads back unchanged."""
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _json_safe(v) for k, v in value.items())
+    if isinstance(value, list):
+        return all(_json_safe(item) for item in value)
+    if isinstance(value, float):
+        # NaN never compares equal to itself after reloading
+        return value == value
+    return isinstance(value, _JSON_SCALARS)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ChartComponent:
     """Represents a component within a Helm chart."""
     name: str
@@ -30,7 +73,7 @@ class ChartComponent:
     source_template: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnhancedChartAnalysis:
     """Enhanced analysis results for a Helm chart."""
     chart: HelmChart
@@ -49,8 +92,19 @@ class EnhancedHelmAnalyzer:
         self.templates_path = chart_path / "templates"
         self.templates: List[Dict[str, Any]] = []
         self.values: Dict[str, Any] = {}
+        self._all_ports: List[int] = []
+        self._all_images: List[str] = []
         self.rule_engine = RuleEngine()
         self.pattern_definitions = load_patterns()
+        self._rule_prefilters = compile_rule_groups(self.pattern_definitions)
+        self._prefilter_hits: Dict[Tuple[Tuple[str, str, bool], str], bool] = {}
+        # None when VPCONVERTER_NO_CACHE disables the cache
+        self.cache_path: Optional[Path] = None
+        if cache_enabled():
+            chart_key = hashlib.sha256(str(chart_path.resolve()).encode()).hexdigest()
+            self.cache_path = TEMPLATE_CACHE_DIR / f"{chart_key}-v{_CACHE_VERSION}.json"
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._cache_dirty = False
 
     def analyze(self) -> EnhancedChartAnalysis:
         """Perform enhanced analysis of the Helm chart."""
@@ -74,7 +128,8 @@ class EnhancedHelmAnalyzer:
             self.values = read_yaml(values_file)
             chart.has_values = True
 
-        # Parse templates
+        # Parse templates, reusing cached results for unchanged files
+        self._cache = self._load_cache()
         self._parse_templates()
 
         # Extract components
@@ -85,12 +140,15 @@ class EnhancedHelmAnalyzer:
 
         # Detect patterns
         patterns = self._detect_patterns(components, resources)
+        resource_kinds = frozenset(resources)
 
         # Analyze security features
-        security_features = self._analyze_security()
+        security_features = self._analyze_security(resources, resource_kinds)
 
         # Analyze scaling features
-        scaling_features = self._analyze_scaling()
+        scaling_features = self._analyze_scaling(resource_kinds)
+
+        self._save_cache()
 
         return EnhancedChartAnalysis(
             chart=chart,
@@ -106,15 +164,25 @@ class EnhancedHelmAnalyzer:
         if not self.templates_path.exists():
             return
 
+        cache = {}
         for template_file in self.templates_path.glob("*.yaml"):
             if template_file.name.startswith('_'):  # Skip helpers
                 continue
 
             try:
+                stat = template_file.stat()
+                cached = self._cache.get(template_file.name)
+                if (cached and cached.get('mtime_ns') == stat.st_mtime_ns
+                        and cached.get('size') == stat.st_size):
+                    self.templates.extend(cached['docs'])
+                    cache[template_file.name] = cached
+                    continue
+
                 with open(template_file, 'r') as f:
                     content = f.read()
 
                 # Handle multi-document YAML
+                parsed_docs = []
                 docs = content.split('\n---\n')
                 for doc in docs:
                     if doc.strip():
@@ -124,28 +192,103 @@ class EnhancedHelmAnalyzer:
                             parsed = self._parse_template_doc(doc)
                             if parsed:
                                 parsed['_source_file'] = template_file.name
-                                self.templates.append(parsed)
+                                parsed_docs.append(parsed)
                         except Exception:
                             pass
+                self.templates.extend(parsed_docs)
+                self._cache_dirty = True
+                # YAML can yield values JSON cannot round-trip (dates, sets,
+                # etc.); such files are simply reparsed next time
+                if _json_safe(parsed_docs):
+                    cache[template_file.name] = {
+                        'mtime_ns': stat.st_mtime_ns,
+                        'size': stat.st_size,
+                        'docs': parsed_docs,
+                    }
             except Exception as e:
                 log_warn(f"Could not parse {template_file}: {e}")
 
+        # Drop entries for templates that were removed since the last run
+        if cache.keys() != self._cache.keys():
+            self._cache_dirty = True
+        self._cache = cache
+
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load parsed templates cached by a previous run, if any."""
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != _CACHE_VERSION:
+            return {}
+        files = data.get('files')
+        if not isinstance(files, dict):
+            return {}
+        touch_cache_file(self.cache_path)
+        # Malformed entries are dropped and their templates reparsed
+        return {
+            name: entry for name, entry in files.items()
+            if isinstance(entry, dict) and isinstance(entry.get('docs'), list)
+        }
+
+    def _save_cache(self) -> None:
+        """Persist parsed templates so unchanged files are skipped next run."""
+        if self.cache_path is None or not self._cache_dirty:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename it into place, so a
+            # concurrent run never reads a partial cache
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({'version': _CACHE_VERSION, 'files': self._cache}, f)
+                os.replace(tmp_name, self.cache_path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            # An unwritable cache directory just means no cache
+            return
+        prune_cache(self.cache_path.parent)
+
     def _parse_template_doc(self, doc: str) -> Optional[Dict[str, Any]]:
         """Parse a single template document, handling Go templates."""
+        # Pure helper/control documents never declare a resource kind,
+        # so skip the YAML parser for them entirely
+        if 'kind' not in doc or doc.lstrip().startswith('{{'):
+            return None
+
         # Remove common Go template constructs for parsing
-        cleaned = re.sub(r'{{\s*[-\s]*.*?[-\s]*\s*}}', 'TEMPLATE_VALUE', doc)
+        cleaned = _GO_TEMPLATE_RE.sub('TEMPLATE_VALUE', doc)
+
+        # Documents that are plain JSON parse much faster with orjson
+        stripped = cleaned.lstrip()
+        if ORJSON_AVAILABLE and stripped.startswith('{'):
+            try:
+                parsed = orjson.loads(stripped)
+            except orjson.JSONDecodeError:
+                pass
+            else:
+                return parsed if isinstance(parsed, dict) and 'kind' in parsed else None
 
         try:
-            parsed = yaml.safe_load(cleaned)
-            if isinstance(parsed, dict) and 'kind' in parsed:
-                return parsed
-        except:
-            pass
+            parsed = yaml.load(cleaned, Loader=YAML_LOADER)
+        except yaml.YAMLError:
+            return None
+        if isinstance(parsed, dict) and 'kind' in parsed:
+            return parsed
         return None
 
     def _extract_components(self) -> List[ChartComponent]:
         """Extract components from templates and dependencies."""
         components = []
+        # Ports and images are collected in the same pass for rule evaluation
+        self._all_ports = []
+        self._all_images = []
 
         # Extract from Deployments
         for template in self.templates:
@@ -156,13 +299,18 @@ class EnhancedHelmAnalyzer:
 
                 for container in pod_spec.get('containers', []):
                     # Extract more details
-                    ports = [p.get('containerPort') for p in container.get('ports', []) if 'containerPort' in p]
+                    ports = [p['containerPort'] for p in container.get('ports', []) if 'containerPort' in p]
+                    image = container.get('image', '')
                     env_vars = container.get('env', [])
 
+                    self._all_ports.extend(ports)
+                    if image:
+                        self._all_images.append(image)
+
                     component = ChartComponent(
                         name=container.get('name', deployment_name),
                         type='container',
-                        image=container.get('image', ''),
+                        image=image,
                         ports=ports,
                         description=f"Container in {deployment_name} with {len(env_vars)} env vars",
                         source_template=template.get('_source_file')
@@ -223,6 +371,7 @@ class EnhancedHelmAnalyzer:
 
         # Prepare analysis context
         context = self._build_analysis_context(components, resources)
+        self._prefilter_hits = {}
 
         # Process each pattern definition
         for pattern_def in self.pattern_definitions:
@@ -264,21 +413,9 @@ class EnhancedHelmAnalyzer:
             if comp.type.startswith('dependency'):
                 dependencies.append(comp.name)
 
-        # Extract all images
-        images = []
-        for comp in components:
-            if comp.image:
-                images.append(comp.image)
-
         # Count services
         service_count = len(resources.get('Service', []))
 
-        # Extract ports
-        ports = []
-        for comp in components:
-            if comp.ports:
-                ports.extend(comp.ports)
-
         # Build context
         return {
             'chart_name': self.chart_path.name,
@@ -288,55 +425,37 @@ class EnhancedHelmAnalyzer:
             'components': components,
             'resources': resources,
             'dependencies': dependencies,
-            'images': images,
+            'images': self._all_images,
             'service_count': service_count,
-            'ports': ports,
+            'ports': self._all_ports,
             'content': str(self.templates) + str(self.values)  # For content searches
         }
 
     def _apply_rule(self, rule: DetectionRule, context: Dict[str, Any]) -> tuple[bool, List[str]]:
         """Apply a single detection rule and return (matched, evidence_list)"""
-        evidence = []
+        evidence: List[str] = []
 
         if rule.type == "dependency":
-            for dep in context['dependencies']:
-                matches = self.rule_engine.match(dep, rule.match_value, rule.match_mode, rule.case_sensitive)
-                for match in matches:
-                    evidence.append(rule.evidence_template.format(match=match))
+            self._match_texts(rule, context['dependencies'], evidence)
 
         elif rule.type == "kind":
-            kinds = [t.get('kind', '') for t in context['templates']]
-            for kind in kinds:
-                matches = self.rule_engine.match(kind, rule.match_value, rule.match_mode, rule.case_sensitive)
-                for match in matches:
-                    evidence.append(rule.evidence_template.format(match=match))
+            self._match_texts(rule, (t.get('kind', '') for t in context['templates']), evidence)
 
         elif rule.type == "image":
-            for image in context['images']:
-                matches = self.rule_engine.match(image, rule.match_value, rule.match_mode, rule.case_sensitive)
-                for match in matches:
-                    evidence.append(rule.evidence_template.format(match=match))
+            self._match_texts(rule, context['images'], evidence)
 
         elif rule.type == "content":
-            matches = self.rule_engine.match(context['content'], rule.match_value, rule.match_mode, rule.case_sensitive)
-            for match in matches:
-                evidence.append(rule.evidence_template.format(match=match))
+            self._match_texts(rule, [context['content']], evidence)
 
         elif rule.type == "api_version":
-            api_versions = [t.get('apiVersion', '') for t in context['templates']]
-            for api_version in api_versions:
-                matches = self.rule_engine.match(api_version, rule.match_value, rule.match_mode, rule.case_sensitive)
-                for match in matches:
-                    evidence.append(rule.evidence_template.format(match=match))
+            self._match_texts(rule, (t.get('apiVersion', '') for t in context['templates']), evidence)
 
         elif rule.type == "service_count":
             if rule.match_mode == "greater_than" and context['service_count'] > rule.match_value:
                 evidence.append(rule.evidence_template.format(count=context['service_count']))
 
         elif rule.type == "chart_name":
-            matches = self.rule_engine.match(context['chart_name'], rule.match_value, rule.match_mode, rule.case_sensitive)
-            for match in matches:
-                evidence.append(rule.evidence_template.format(match=match))
+            self._match_texts(rule, [context['chart_name']], evidence)
 
         elif rule.type == "port":
             for port in context['ports']:
@@ -344,15 +463,37 @@ class EnhancedHelmAnalyzer:
                     evidence.append(rule.evidence_template.format(match=port))
 
         elif rule.type == "annotation":
-            for template in context['templates']:
-                annotations = template.get('metadata', {}).get('annotations', {})
-                for annotation_key in annotations.keys():
-                    matches = self.rule_engine.match(annotation_key, rule.match_value, rule.match_mode, rule.case_sensitive)
-                    for match in matches:
-                        evidence.append(rule.evidence_template.format(match=match))
+            annotation_keys = (
+                annotation_key
+                for template in context['templates']
+                for annotation_key in template.get('metadata', {}).get('annotations', {}).keys()
+            )
+            self._match_texts(rule, annotation_keys, evidence)
 
         return len(evidence) > 0, evidence
 
+    def _match_texts(self, rule: DetectionRule, texts: Iterable[str], evidence: List[str]) -> None:
+        """Match a rule against each text, appending formatted evidence."""
+        for text in texts:
+            if not self._rule_may_match(rule, text):
+                continue
+            matches = self.rule_engine.match(text, rule.match_value, rule.match_mode, rule.case_sensitive)
+            for match in matches:
+                evidence.append(rule.evidence_template.format(match=match))
+
+    def _rule_may_match(self, rule: DetectionRule, text: str) -> bool:
+        """Check the fused group prefilter, scanning each text once per group."""
+        key = rule_group_key(rule)
+        prefilter = self._rule_prefilters.get(key)
+        if prefilter is None:
+            return True
+
+        hit = self._prefilter_hits.get((key, text))
+        if hit is None:
+            hit = prefilter.search(text if rule.case_sensitive else text.lower()) is not None
+            self._prefilter_hits[(key, text)] = hit
+        return hit
+
     # Remove old pattern detection methods as they're replaced by rule engine
     def _detect_ai_ml_pattern(self, components: List[ChartComponent]) -> ArchitecturePattern:
         """DEPRECATED: Use rule-based detection instead"""
@@ -379,16 +520,12 @@ class EnhancedHelmAnalyzer:
         """DEPRECATED: Use rule-based detection instead"""
         return ArchitecturePattern(name="Cloud Native", confidence=0.0, evidence=[], description="Use rule engine")
 
-    def _analyze_security(self) -> List[str]:
+    def _analyze_security(self, resources: Dict[str, List[str]], resource_kinds: FrozenSet[str]) -> List[str]:
         """Analyze security features."""
         features = []
 
-        # Extract resources for this method
-        resources = self._extract_resources_by_kind()
-
         # Check for RBAC
-        rbac_kinds = ['Role', 'ClusterRole', 'RoleBinding', 'ClusterRoleBinding']
-        if any(kind in resources for kind in rbac_kinds):
+        if _RBAC_KINDS & resource_kinds:
             features.append("RBAC configuration")
 
         # Check for TLS
@@ -400,7 +537,7 @@ class EnhancedHelmAnalyzer:
             features.append(f"Secrets management ({len(resources['Secret'])} secrets)")
 
         # Check for NetworkPolicy
-        if 'NetworkPolicy' in resources:
+        if 'NetworkPolicy' in resource_kinds:
             features.append("Network policies")
 
         # Check for security contexts
@@ -411,15 +548,12 @@ class EnhancedHelmAnalyzer:
 
         return features
 
-    def _analyze_scaling(self) -> List[str]:
+    def _analyze_scaling(self, resource_kinds: FrozenSet[str]) -> List[str]:
         """Analyze scaling features."""
         features = []
 
-        # Extract resources for this method
-        resources = self._extract_resources_by_kind()
-
         # HPA
-        if 'HorizontalPodAutoscaler' in resources:
+        if 'HorizontalPodAutoscaler' in resource_kinds:
             features.append("Horizontal Pod Autoscaling (HPA)")
 
         # Check for replicas > 1
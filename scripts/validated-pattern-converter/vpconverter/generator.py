@@ -5,19 +5,18 @@ This module generates the validated pattern directory structure
 and configuration files based on analysis results.
 """
 
+import itertools
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-
-from jinja2 import Environment, BaseLoader
-import yaml
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple, Union, TYPE_CHECKING
 
 from .analyzer import AnalysisResult, HelmChart
 from .models import PatternData, ClusterGroupData, ClusterGroupApplication, ClusterGroupSubscription
 from .config import PATTERN_DIRS, VERSION, CLUSTERGROUP_VERSION, DEFAULT_PRODUCTS
-from .pattern_configurator import PatternConfigurator
-from .product_detector import ProductDetector
 from .templates import (
     GITIGNORE_TEMPLATE,
     ANSIBLE_CFG_TEMPLATE,
@@ -31,6 +30,7 @@ from .templates import (
     README_TEMPLATE,
     WRAPPER_CHART_TEMPLATE,
     WRAPPER_VALUES_TEMPLATE,
+    WRAPPER_NAMESPACE_TEMPLATE,
     ARGOCD_APPLICATION_TEMPLATE,
     VALIDATION_SCRIPT_TEMPLATE,
     CONVERSION_REPORT_TEMPLATE,
@@ -39,84 +39,351 @@ from .templates import (
     BOOTSTRAP_APPLICATION_TEMPLATE,
     PATTERN_INSTALL_SCRIPT_TEMPLATE,
     MAKEFILE_BOOTSTRAP_TEMPLATE,
-    IMPERATIVE_JOB_TEMPLATE
+    IMPERATIVE_JOB_TEMPLATE,
+    TEMPLATES
 )
 from .utils import (
     log_info, log_success, log_error, log_warn,
-    ensure_directory, write_yaml, console
+    ensure_directory, write_yaml, progress_status, YAML_LOADER,
+    buffered_logs, print_logs
 )
 
+# jinja2 and the configurator/detector modules are imported where they are
+# first used, so commands that never generate a pattern skip their import cost
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+    from .product_detector import DetectedProduct, ProductDetector
+
+_JINJA_ENV: Optional["Environment"] = None
+
+# Template constants by their source text, to look them up in the loader
+_TEMPLATE_NAMES = {source: name for name, source in TEMPLATES.items()}
+
+
+def _jinja_environment() -> "Environment":
+    """Return the shared Jinja2 environment, creating it on first use.
+
+    Compiled bytecode is kept in Jinja2's per-user temp cache between runs
+    when a safe cache directory is available.
+    """
+    global _JINJA_ENV
+    if _JINJA_ENV is None:
+        from jinja2 import Environment, DictLoader, FileSystemBytecodeCache
+        try:
+            bytecode_cache = FileSystemBytecodeCache()
+        except (OSError, RuntimeError):
+            bytecode_cache = None
+        # Template constants are served by name so Jinja2's own (unbounded)
+        # template cache and the bytecode cache apply to them
+        _JINJA_ENV = Environment(
+            loader=DictLoader(TEMPLATES),
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=bytecode_cache,
+        )
+    return _JINJA_ENV
+
+
+def _keyword_rules(rules: List[Tuple[Tuple[str, ...], Tuple[str, ...]]]) -> List[Tuple["re.Pattern", Tuple[str, ...]]]:
+    """Compile (keywords, labels) rules into one substring regex per rule."""
+    return [(re.compile("|".join(map(re.escape, keywords))), labels) for keywords, labels in rules]
+
+
+# Chart-name keywords (matched as substrings of the lowercased name) and the
+# metadata labels they add
+_CATEGORY_RULES = _keyword_rules([
+    (("web", "ui", "frontend"), ("web",)),
+    (("api", "service", "backend"), ("microservices",)),
+    (("data", "analytics", "metrics"), ("data",)),
+])
+_LANGUAGE_RULES = _keyword_rules([
+    (("python", "py", "flask", "django"), ("python",)),
+    (("node", "js", "express", "react", "angular"), ("javascript", "nodejs")),
+    (("java", "spring", "tomcat"), ("java",)),
+    (("go", "golang"), ("go",)),
+    (("rust", "rs"), ("rust",)),
+])
+_INDUSTRY_RULES = _keyword_rules([
+    (("finance", "banking", "payment"), ("financial-services",)),
+    (("health", "medical", "patient"), ("healthcare",)),
+    (("retail", "ecommerce", "shop"), ("retail",)),
+    (("manufacturing", "iot", "sensor"), ("manufacturing",)),
+])
+
+
+def _chart_names_text(analysis_result: AnalysisResult) -> str:
+    """Lowercased chart names, one per line, for the keyword rules."""
+    return "\n".join(chart.name.lower() for chart in analysis_result.helm_charts)
+
+
+def _labels_from_names(chart_names: str, rules: List[Tuple["re.Pattern", Tuple[str, ...]]]) -> List[str]:
+    """Labels of every rule whose keywords occur in any chart name.
+
+    chart_names is _chart_names_text() output; no keyword spans a newline,
+    so one search of the joined text matches any single name.
+    """
+    labels: List[str] = []
+    for pattern, rule_labels in rules:
+        if pattern.search(chart_names):
+            labels.extend(rule_labels)
+    return labels
+
+
+# Platforms that get an override values file, and its content as bytes
+# ready to write, filled in with %-formatting
+_PLATFORMS = ("AWS", "Azure", "GCP", "IBMCloud", "OpenStack")
+_PLATFORM_OVERRIDE_TEMPLATE = b"""\
+# Platform-specific overrides for %(platform)s
+# Add platform-specific configurations here
+
+global:
+  clusterPlatform: %(platform_lower)s
+  
+# Example platform-specific configurations:
+# storageClass: %(platform_lower)s-storage
+# domainSuffix: %(platform_lower)s.example.com
+"""
+
+
+# A bare {{ name }} substitution, and any other Jinja2 syntax
+_PLACEHOLDER_RE = re.compile(r'{{\s*(\w+)\s*}}')
+_JINJA_SYNTAX_RE = re.compile(r'{[{%#]')
+
+
+class _MissingAsEmpty(dict):
+    """Context mapping that renders unknown names as '' like Jinja2 does."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+class _FormatTemplate:
+    """Renders a template whose only dynamic parts are {{ name }} placeholders.
+
+    Such templates need no Jinja2 machinery; a str.format_map pattern built
+    once produces the same output.
+    """
+
+    def __init__(self, format_string: str):
+        self._format_string = format_string
+
+    @classmethod
+    def from_source(cls, source: str) -> Optional["_FormatTemplate"]:
+        """Build a format-based template, or None if source needs Jinja2."""
+        # Jinja2 drops a single trailing newline by default
+        if source.endswith("\n"):
+            source = source[:-1]
+
+        parts = _PLACEHOLDER_RE.split(source)
+        literals = parts[::2]
+        if any(_JINJA_SYNTAX_RE.search(literal) for literal in literals):
+            return None
+
+        pieces = []
+        for i, part in enumerate(parts):
+            if i % 2:
+                pieces.append("{" + part + "}")
+            else:
+                pieces.append(part.replace("{", "{{").replace("}", "}}"))
+        return cls("".join(pieces))
+
+    def render(self, **context: Any) -> str:
+        return self._format_string.format_map(_MissingAsEmpty(context))
+
 
 class PatternGenerator:
     """Generates validated pattern structure and files."""
 
+    # Templates are module-level constants, so the environment and the
+    # compiled templates are shared by every generator instance
+    _template_cache: Dict[str, Union["Template", _FormatTemplate]] = {}
+
     def __init__(self, pattern_name: str, pattern_dir: Path, github_org: str = "your-org", source_dir: Optional[Path] = None):
         """Initialize generator with pattern configuration."""
         self.pattern_name = pattern_name
         self.pattern_dir = pattern_dir
         self.github_org = github_org
         self.source_dir = source_dir
-        self.env = Environment(loader=BaseLoader())
+        # Repository name and URL used by several template contexts
+        self._pattern_dir_name = pattern_dir.name
+        self._git_repo_url = f"https://github.com/{github_org}/{self._pattern_dir_name}"
+        # Directories already created under pattern_dir, so writes skip mkdir
+        self._known_dirs: Set[Path] = set()
+        # While generate() runs, written paths are collected here and logged
+        # once at the end instead of one console line per file
+        self._generated: Optional[List[str]] = None
+        # Per-thread list of written files while a step runs in _run_steps
+        self._local = threading.local()
+        # Placeholder files deferred during generate(), created together by
+        # _create_placeholders
+        self._pending_placeholders: List[str] = []
+        # Product detection runs once per generate() and is shared by the
+        # pattern metadata and the ClusterGroup chart
+        self._product_detector: Optional["ProductDetector"] = None
+        self._detected_products: Optional[List["DetectedProduct"]] = None
+        # Generation time, captured once so every generated file that
+        # records it agrees
+        self._now: Optional[datetime] = None
+        # Rendered values-hub.yaml, kept so pattern configurations are
+        # merged into it without reading the file back
+        self._hub_values: Optional[str] = None
 
     def generate(self, analysis_result: AnalysisResult) -> None:
         """Generate complete validated pattern structure."""
         log_info("Starting validated pattern generation...")
 
-        with console.status("[bold green]Generating pattern structure...") as status:
-            # Create directory structure
-            status.update("Creating directory hierarchy...")
-            self._create_directories()
-
-            # Generate base configuration files
-            status.update("Generating configuration files...")
-            self._generate_base_files(analysis_result)
-
-            # Generate values files
-            status.update("Generating values files...")
-            self._generate_values_files(analysis_result)
-
-            # Generate ClusterGroup chart (CRITICAL)
-            status.update("Generating ClusterGroup chart...")
-            self._generate_clustergroup_chart(analysis_result)
-
-            # Generate wrapper charts for discovered Helm charts
-            status.update("Generating wrapper charts...")
-            for chart in analysis_result.helm_charts:
-                self.generate_wrapper_chart(chart, site="all")
+        self._generated = []
+        self._now = datetime.now()
+        try:
+            self._generate_all(analysis_result)
+        finally:
+            self._pending_placeholders = []
+            self._product_detector = None
+            self._detected_products = None
+            self._now = None
+            self._hub_values = None
+            generated, self._generated = self._generated, None
+            if generated:
+                log_info(f"  ✓ Generated {len(generated)} files:\n" +
+                         "\n".join(f"      {path}" for path in generated))
 
-            # Generate bootstrap application
-            status.update("Generating bootstrap mechanism...")
-            self._generate_bootstrap_files()
+        log_success(f"Pattern structure generated in: {self.pattern_dir}")
 
-            # Apply pattern-specific configurations
+    def _generate_all(self, analysis_result: AnalysisResult) -> None:
+        """Run every generation step under a single status spinner."""
+        with progress_status("[bold green]Generating pattern structure...") as status:
+            # Create directory structure
+            status.update("Creating directory hierarchy...")
+            self._create_directories(analysis_result)
+
+            # Scan for products before the concurrent steps, which share it
+            status.update("Detecting products...")
+            self._detect_products(analysis_result)
+
+            # These steps write disjoint files and only read shared state,
+            # so they run concurrently: base configuration files, values
+            # files, the ClusterGroup chart (CRITICAL), wrapper charts for
+            # discovered Helm charts, the bootstrap mechanism, validation
+            # scripts and platform overrides
+            status.update("Generating configuration, values, charts and scripts...")
+            steps: List[Tuple[Callable[..., None], Tuple[Any, ...]]] = [
+                (self._generate_base_files, (analysis_result,)),
+                (self._generate_values_files, (analysis_result,)),
+                (self._generate_clustergroup_chart, (analysis_result,)),
+            ]
+            steps.extend((self.generate_wrapper_chart, (chart, "all"))
+                         for chart in analysis_result.helm_charts)
+            steps.extend([
+                (self._generate_bootstrap_files, ()),
+                (self._generate_scripts, (analysis_result,)),
+                (self._generate_platform_overrides, ()),
+            ])
+            self._run_steps(steps)
+
+            # Apply pattern-specific configurations (updates values-hub.yaml)
             status.update("Applying pattern-specific configurations...")
-            self._apply_pattern_configurations(analysis_result)
+            pattern_configs = self._apply_pattern_configurations(analysis_result)
 
-            # Generate scripts
-            status.update("Generating validation scripts...")
-            self._generate_scripts(analysis_result)
-
-            # Generate documentation
+            # Generate documentation; the conversion report includes the
+            # applied pattern configurations
             status.update("Generating documentation...")
-            self._generate_documentation(analysis_result)
+            self._generate_documentation(analysis_result, pattern_configs)
 
             # Create empty placeholder files
             status.update("Creating placeholder files...")
             self._create_placeholders()
 
-            # Generate platform overrides
-            status.update("Generating platform overrides...")
-            self._generate_platform_overrides()
+    def _run_steps(self, steps: List[Tuple[Callable[..., None], Tuple[Any, ...]]]) -> None:
+        """Run independent generation steps on a thread pool.
+
+        Each step's log lines are printed, and the files it writes are
+        recorded, in step order, so neither the console output nor the
+        generate() summary depends on thread scheduling.
+        """
+        max_workers = min(8, os.cpu_count() or 1, len(steps))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._run_step, step, args) for step, args in steps]
+            for future in futures:
+                generated, lines = future.result()
+                print_logs(lines)
+                for relative_path in generated:
+                    self._record_generated(relative_path)
+
+    def _run_step(self, step: Callable[..., None], args: Tuple[Any, ...]) -> Tuple[List[str], List[str]]:
+        """Run one generation step, collecting the files it writes and its log lines."""
+        generated: List[str] = []
+        self._local.generated = generated
+        try:
+            with buffered_logs() as lines:
+                try:
+                    step(*args)
+                except Exception:
+                    # The step's own error messages go out with the failure
+                    print_logs(lines)
+                    raise
+            return generated, lines
+        finally:
+            self._local.generated = None
+
+    def _create_directories(self, analysis_result: Optional[AnalysisResult] = None) -> None:
+        """Create the validated pattern directory structure."""
+        dirs = [self.pattern_dir / dir_path for dir_path in PATTERN_DIRS]
 
-        log_success(f"Pattern structure generated in: {self.pattern_dir}")
+        # Chart directories written later in generate() are known up front
+        dirs.append(self.pattern_dir / "charts" / "hub" / "clustergroup" / "templates")
+        if analysis_result:
+            for chart in analysis_result.helm_charts:
+                dirs.append(self.pattern_dir / "charts" / "all" / chart.name / "templates")
+
+        # Deepest first: creating a leaf creates (and records) its parents,
+        # so _ensure_dir skips the shallower entries
+        for path in sorted(dirs, key=lambda p: len(p.parts), reverse=True):
+            self._ensure_dir(path)
 
-    def _create_directories(self) -> None:
-        """Create the validated pattern directory structure."""
         for dir_path in PATTERN_DIRS:
-            full_path = self.pattern_dir / dir_path
-            ensure_directory(full_path)
             log_info(f"  ✓ Created: {dir_path}/")
 
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory (and parents) unless it was already created."""
+        if path in self._known_dirs:
+            return
+        ensure_directory(path)
+        self._known_dirs.add(path)
+        # Parents exist now too, so later writes there skip mkdir as well
+        self._known_dirs.update(parent for parent in path.parents if self.pattern_dir in parent.parents)
+
+    def _generation_time(self) -> datetime:
+        """Time of the current generate() run, or now outside of one."""
+        return self._now if self._now is not None else datetime.now()
+
+    def _get_product_detector(self) -> "ProductDetector":
+        """Return the detector shared by the steps of one generate() run."""
+        if self._product_detector is None:
+            from .product_detector import ProductDetector
+            self._product_detector = ProductDetector()
+        return self._product_detector
+
+    def _detect_products(self, analysis_result: AnalysisResult) -> List["DetectedProduct"]:
+        """Detect products from the analyzed Helm charts and YAML files."""
+        detector = self._get_product_detector()
+
+        # Detect from Helm charts (using the chart paths from the analysis)
+        # and from any other YAML files. The analyzer found these by walking
+        # the tree, and detect_from_path yields nothing for a vanished path.
+        paths = [Path(chart.path) for chart in analysis_result.helm_charts]
+        paths.extend(analysis_result.yaml_files)
+
+        # Detection is dominated by file reads, so fan it out over threads;
+        # map() keeps the results in path order
+        if len(paths) > 1:
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(paths))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(detector.detect_from_path, paths))
+        else:
+            results = [detector.detect_from_path(path) for path in paths]
+        self._detected_products = list(itertools.chain.from_iterable(results))
+        return self._detected_products
+
     def _generate_base_files(self, analysis_result: AnalysisResult) -> None:
         """Generate base configuration files."""
         # .gitignore
@@ -130,53 +397,46 @@ class PatternGenerator:
 
         # Makefile with pattern name context
         context = {"pattern_name": self.pattern_name}
-        self._render_and_write("Makefile", MAKEFILE_TEMPLATE, context)
+        jobs = [("Makefile", MAKEFILE_TEMPLATE, context)]
 
         # pattern-metadata.yaml with products
         products = list(DEFAULT_PRODUCTS)
 
         # Use product detector to find pattern-specific products
-        detector = ProductDetector()
-        detected_products = []
-
-        # Detect from Helm charts
-        for chart in analysis_result.helm_charts:
-            # Use the chart path directly from analysis result
-            if Path(chart.path).exists():
-                detected = detector.detect_from_path(Path(chart.path))
-                detected_products.extend(detected)
-
-        # Detect from any other YAML files
-        for yaml_file in analysis_result.yaml_files:
-            if yaml_file.exists():
-                detected = detector.detect_from_path(yaml_file)
-                detected_products.extend(detected)
+        detector = self._get_product_detector()
+        detected_products = self._detected_products
+        if detected_products is None:
+            detected_products = self._detect_products(analysis_result)
 
         # Merge detected products with defaults
         final_products = detector.merge_products(products, detected_products)
 
         # Log detected products
         if detected_products:
-            log_info(f"  ✓ Detected {len(detected_products)} additional products")
+            lines = [f"  ✓ Detected {len(detected_products)} additional products"]
             for product in detected_products:
                 confidence_marker = "" if product.confidence == "high" else f" ({product.confidence} confidence)"
-                log_info(f"    - {product.name}: {product.version}{confidence_marker}")
+                lines.append(f"    - {product.name}: {product.version}{confidence_marker}")
+            log_info("\n".join(lines))
 
-        # Create enhanced pattern metadata context
+        # Create enhanced pattern metadata context; chart names are
+        # lowercased once for all three label detectors
+        chart_names = _chart_names_text(analysis_result)
         context = {
             "pattern_name": self.pattern_name,
             "pattern_display_name": self.pattern_name.replace('-', ' ').title() + " Pattern",
             "pattern_description": f"Validated pattern for {self.pattern_name.replace('-', ' ')} deployment on OpenShift using GitOps",
             "github_org": self.github_org,
-            "pattern_dir": self.pattern_dir.name,
+            "pattern_dir": self._pattern_dir_name,
             "products": final_products,
-            "categories": self._detect_categories(analysis_result),
-            "languages": self._detect_languages(analysis_result),
-            "industries": self._detect_industries(analysis_result),
+            "categories": self._detect_categories(analysis_result, chart_names),
+            "languages": self._detect_languages(analysis_result, chart_names),
+            "industries": self._detect_industries(analysis_result, chart_names),
             "detected_patterns": list(analysis_result.detected_patterns) if hasattr(analysis_result, 'detected_patterns') else [],
-            "creation_date": datetime.now().isoformat()
+            "creation_date": self._generation_time().isoformat()
         }
-        self._render_and_write("pattern-metadata.yaml", PATTERN_METADATA_TEMPLATE, context)
+        jobs.append(("pattern-metadata.yaml", PATTERN_METADATA_TEMPLATE, context))
+        self._render_and_write_all(jobs)
 
     def _generate_values_files(self, analysis_result: AnalysisResult) -> None:
         """Generate values-*.yaml files."""
@@ -184,12 +444,14 @@ class PatternGenerator:
         context = {"pattern_name": self.pattern_name}
         self._render_and_write("values-global.yaml", VALUES_GLOBAL_TEMPLATE, context)
 
-        # values-hub.yaml
+        # values-hub.yaml; the rendered text is kept for
+        # _apply_pattern_configurations
         context = {
             "helm_charts": analysis_result.helm_charts,
             "pattern_name": self.pattern_name
         }
-        self._render_and_write("values-hub.yaml", VALUES_HUB_TEMPLATE, context)
+        self._hub_values = self._compile_template(VALUES_HUB_TEMPLATE).render(**context)
+        self._write_file("values-hub.yaml", self._hub_values)
 
         # values-region.yaml
         context = {
@@ -201,9 +463,13 @@ class PatternGenerator:
         # values-secret.yaml.template
         self._write_file("values-secret.yaml.template", VALUES_SECRET_TEMPLATE)
 
-    def _apply_pattern_configurations(self, analysis_result: AnalysisResult) -> None:
-        """Apply pattern-specific configurations to values files."""
+    def _apply_pattern_configurations(self, analysis_result: AnalysisResult) -> Dict[str, Any]:
+        """Apply pattern-specific configurations to values files.
+
+        Returns the applied configurations for the conversion report.
+        """
         # Initialize pattern configurator
+        from .pattern_configurator import PatternConfigurator
         configurator = PatternConfigurator(analysis_result)
 
         # Generate pattern-specific configurations
@@ -214,103 +480,116 @@ class PatternGenerator:
             for pattern_name in pattern_configs:
                 log_info(f"  • {pattern_name}")
 
-            # Apply configurations to values-hub.yaml
+            # Apply configurations to values-hub.yaml, parsing the text
+            # generated earlier in this run instead of reading it back
             hub_values_file = self.pattern_dir / "values-hub.yaml"
-            configurator.apply_to_values(hub_values_file, pattern_configs)
+            values = None
+            if self._hub_values is not None:
+                import yaml
+                values = yaml.load(self._hub_values, Loader=YAML_LOADER) or {}
+            configurator.apply_to_values(hub_values_file, pattern_configs, values)
 
             # Generate resource files for each pattern
             configurator.generate_resource_files(self.pattern_dir, pattern_configs)
-
-            # Update conversion report with pattern configurations
-            self._update_report_with_patterns(pattern_configs)
         else:
             log_info("No specific pattern configurations needed")
 
-    def _update_report_with_patterns(self, pattern_configs: Dict[str, Any]) -> None:
-        """Update conversion report with pattern-specific configurations."""
-        report_file = self.pattern_dir / "CONVERSION-REPORT.md"
-        if report_file.exists():
-            with open(report_file, 'a') as f:
-                f.write("\n\n## Pattern-Specific Configurations Applied\n\n")
-                for pattern_name, config in pattern_configs.items():
-                    f.write(f"### {pattern_name.replace('_', ' ').title()}\n")
-                    f.write(f"- Namespaces: {', '.join(config.namespaces)}\n")
-                    f.write(f"- Operators: {len(config.subscriptions)}\n")
-                    f.write(f"- Applications: {len(config.applications)}\n")
-                    if config.resources:
-                        f.write(f"- Resource configurations: {len(config.resources)}\n")
-                    if config.policies:
-                        f.write(f"- Policies: {len(config.policies)}\n")
-                    f.write("\n")
+        return pattern_configs
+
+    def _pattern_report_section(self, pattern_configs: Optional[Dict[str, Any]]) -> str:
+        """Build the conversion report section for pattern configurations."""
+        if not pattern_configs:
+            return ""
+
+        lines = ["\n\n## Pattern-Specific Configurations Applied\n\n"]
+        for pattern_name, config in pattern_configs.items():
+            lines.append(f"### {pattern_name.replace('_', ' ').title()}\n")
+            lines.append(f"- Namespaces: {', '.join(config.namespaces)}\n")
+            lines.append(f"- Operators: {len(config.subscriptions)}\n")
+            lines.append(f"- Applications: {len(config.applications)}\n")
+            if config.resources:
+                lines.append(f"- Resource configurations: {len(config.resources)}\n")
+            if config.policies:
+                lines.append(f"- Policies: {len(config.policies)}\n")
+            lines.append("\n")
+        return "".join(lines)
 
     def _generate_scripts(self, analysis_result: AnalysisResult) -> None:
         """Generate utility scripts."""
-        # Generate validation script
-        namespace_list = ""
-        app_list = ""
-
-        if analysis_result.helm_charts:
-            namespaces = [f" {chart.name}" for chart in analysis_result.helm_charts]
-            namespace_list = "".join(namespaces)
-
-            apps = [f" {chart.name}" for chart in analysis_result.helm_charts]
-            app_list = "".join(apps)
+        # Generate validation script; each chart gets a namespace and an
+        # application of the same name
+        chart_names = "".join(f" {chart.name}" for chart in analysis_result.helm_charts)
 
         context = {
-            "namespace_list": namespace_list,
-            "app_list": app_list
+            "namespace_list": chart_names,
+            "app_list": chart_names
         }
 
-        script_path = self.pattern_dir / "scripts" / "validate-deployment.sh"
+        # Script is created executable
         self._render_and_write(
             "scripts/validate-deployment.sh",
             VALIDATION_SCRIPT_TEMPLATE,
-            context
+            context,
+            mode=0o755
         )
 
-        # Make script executable
-        os.chmod(script_path, 0o755)
-
-    def _generate_documentation(self, analysis_result: AnalysisResult) -> None:
+    def _generate_documentation(self, analysis_result: AnalysisResult,
+                                pattern_configs: Optional[Dict[str, Any]] = None) -> None:
         """Generate documentation files."""
         # README.md
         context = {
             "pattern_name": self.pattern_name,
             "github_org": self.github_org,
-            "pattern_dir": self.pattern_dir.name,
+            "pattern_dir": self._pattern_dir_name,
             "helm_charts": analysis_result.helm_charts
         }
-        self._render_and_write("README.md", README_TEMPLATE, context)
+        jobs: List[Tuple[Any, ...]] = [("README.md", README_TEMPLATE, context)]
 
         # CONVERSION-REPORT.md
         context = {
             "pattern_name": self.pattern_name,
             "source_repo": str(analysis_result.source_path),
-            "conversion_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "conversion_date": self._generation_time().strftime("%Y-%m-%d %H:%M:%S"),
             "version": VERSION,
             "helm_charts_count": len(analysis_result.helm_charts),
             "yaml_files_count": len(analysis_result.yaml_files),
             "scripts_count": len(analysis_result.script_files),
             "detected_patterns": list(analysis_result.detected_patterns)
         }
-        self._render_and_write("CONVERSION-REPORT.md", CONVERSION_REPORT_TEMPLATE, context)
+        # Pattern configurations are appended to the rendered report, so the
+        # file is written once
+        jobs.append(("CONVERSION-REPORT.md", CONVERSION_REPORT_TEMPLATE, context, 0o666,
+                     self._pattern_report_section(pattern_configs)))
+        self._render_and_write_all(jobs)
 
     def _create_placeholders(self) -> None:
         """Create placeholder files for empty directories."""
-        placeholders = [
+        placeholders = self._pending_placeholders + [
             "overrides/.gitkeep",
             "tests/interop/.gitkeep"
         ]
+        self._pending_placeholders = []
 
         for placeholder in placeholders:
-            file_path = self.pattern_dir / placeholder
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.touch()
+            self._touch(placeholder)
+
+    def _add_placeholder(self, relative_path: str) -> None:
+        """Create a placeholder file, or defer it while generate() runs."""
+        if self._generated is not None:
+            self._pending_placeholders.append(relative_path)
+        else:
+            self._touch(relative_path)
+
+    def _touch(self, relative_path: str) -> None:
+        """Create an empty file if it does not exist yet."""
+        file_path = self.pattern_dir / relative_path
+        self._ensure_dir(file_path.parent)
+        os.close(os.open(file_path, os.O_WRONLY | os.O_CREAT, 0o666))
 
     def generate_wrapper_chart(self, chart: HelmChart, site: str = "all") -> None:
         """Generate ArgoCD wrapper chart for a Helm chart."""
         wrapper_dir = self.pattern_dir / "charts" / site / chart.name
-        ensure_directory(wrapper_dir / "templates")
+        self._ensure_dir(wrapper_dir / "templates")
 
         # Generate Chart.yaml
         context = {
@@ -323,27 +602,19 @@ class PatternGenerator:
             context
         )
 
-        # Generate values.yaml
+        # Generate values.yaml; the default revision is resolved here so the
+        # template is plain substitution and skips Jinja2
         self._render_and_write(
             f"charts/{site}/{chart.name}/values.yaml",
             WRAPPER_VALUES_TEMPLATE,
-            context
+            {**context, "target_revision": chart.version or "1.0.0"}
         )
 
         # Generate namespace template instead of application
-        namespace_template = f"""\
-apiVersion: v1
-kind: Namespace
-metadata:
-  name: {chart.name}
-  labels:
-    argocd.argoproj.io/managed-by: openshift-gitops
-  annotations:
-    argocd.argoproj.io/sync-wave: "100"
-"""
-        self._write_file(
+        self._render_and_write(
             f"charts/{site}/{chart.name}/templates/namespace.yaml",
-            namespace_template
+            WRAPPER_NAMESPACE_TEMPLATE,
+            context
         )
 
         log_info(f"  ✓ Created wrapper chart: charts/{site}/{chart.name}/")
@@ -351,8 +622,7 @@ metadata:
     def _generate_clustergroup_chart(self, analysis_result: Optional[AnalysisResult] = None) -> None:
         """Generate the ClusterGroup chart that serves as the pattern entry point."""
         chart_dir = self.pattern_dir / "charts" / "hub" / "clustergroup"
-        ensure_directory(chart_dir)
-        ensure_directory(chart_dir / "templates")
+        self._ensure_dir(chart_dir / "templates")
 
         # Create pattern data from analysis result
         pattern_data = self._create_pattern_data(analysis_result)
@@ -388,7 +658,7 @@ metadata:
         )
 
         # Create .gitkeep in templates directory
-        (chart_dir / "templates" / ".gitkeep").touch()
+        self._add_placeholder("charts/hub/clustergroup/templates/.gitkeep")
 
         log_info("  ✓ Created ClusterGroup chart: charts/hub/clustergroup/")
 
@@ -398,7 +668,7 @@ metadata:
         pattern_data = PatternData(
             name=self.pattern_name,
             description=f"Validated pattern for {self.pattern_name}",
-            git_repo_url=f"https://github.com/{self.github_org}/{self.pattern_dir.name}",
+            git_repo_url=self._git_repo_url,
             git_branch="main",
             hub_cluster_domain="apps.hub.example.com",
             local_cluster_domain="apps.hub.example.com"
@@ -471,9 +741,9 @@ metadata:
                     )
                 )
             
-            # Detect product versions
-            product_detector = ProductDetector()
-            detected_products = product_detector.detect_product_versions(analysis_result)
+            # Detect product versions; the shared detector has already
+            # parsed the chart and YAML files
+            detected_products = self._get_product_detector().detect_product_versions(analysis_result)
             pattern_data.products = detected_products
 
         return pattern_data
@@ -482,12 +752,12 @@ metadata:
         """Generate bootstrap application and common framework integration."""
         # Create bootstrap directory
         bootstrap_dir = self.pattern_dir / "bootstrap"
-        ensure_directory(bootstrap_dir)
+        self._ensure_dir(bootstrap_dir)
 
         # Generate bootstrap application
         context = {
             "pattern_name": self.pattern_name,
-            "git_repo": f"https://github.com/{self.github_org}/{self.pattern_dir.name}",
+            "git_repo": self._git_repo_url,
             "target_revision": "main"
         }
         self._render_and_write(
@@ -511,9 +781,7 @@ echo ""
 echo "For more information: https://validatedpatterns.io/patterns/"
 exit 1
 """
-        pattern_sh_path = self.pattern_dir / "pattern.sh"
-        self._write_file("pattern.sh", pattern_sh_content)
-        os.chmod(pattern_sh_path, 0o755)
+        self._write_file("pattern.sh", pattern_sh_content, mode=0o755)
 
         # Generate setup script for common framework
         setup_script = f"""\
@@ -560,13 +828,11 @@ echo "2. Run: make install"
 echo ""
 echo "For more information: https://validatedpatterns.io/patterns/"
 """
-        setup_script_path = self.pattern_dir / "scripts" / "setup.sh"
-        self._write_file("scripts/setup.sh", setup_script)
-        os.chmod(setup_script_path, 0o755)
+        self._write_file("scripts/setup.sh", setup_script, mode=0o755)
 
         log_info("  ✓ Created bootstrap mechanism and common framework integration")
 
-    def _detect_categories(self, analysis_result: AnalysisResult) -> List[str]:
+    def _detect_categories(self, analysis_result: AnalysisResult, chart_names: Optional[str] = None) -> List[str]:
         """Detect pattern categories based on analysis."""
         categories = ["gitops", "kubernetes"]
         
@@ -585,38 +851,24 @@ echo "For more information: https://validatedpatterns.io/patterns/"
                 categories.extend(["mlops", "devops"])
         
         # Add categories based on chart names
-        for chart in analysis_result.helm_charts:
-            chart_name = chart.name.lower()
-            if any(keyword in chart_name for keyword in ["web", "ui", "frontend"]):
-                categories.append("web")
-            if any(keyword in chart_name for keyword in ["api", "service", "backend"]):
-                categories.append("microservices")
-            if any(keyword in chart_name for keyword in ["data", "analytics", "metrics"]):
-                categories.append("data")
+        if chart_names is None:
+            chart_names = _chart_names_text(analysis_result)
+        categories.extend(_labels_from_names(chart_names, _CATEGORY_RULES))
         
-        return list(set(categories))  # Remove duplicates
+        return list(dict.fromkeys(categories))  # Remove duplicates, keeping first-seen order
 
-    def _detect_languages(self, analysis_result: AnalysisResult) -> List[str]:
+    def _detect_languages(self, analysis_result: AnalysisResult, chart_names: Optional[str] = None) -> List[str]:
         """Detect programming languages used in the pattern."""
         languages = ["yaml", "helm"]
         
         # Check for common language patterns in chart names
-        for chart in analysis_result.helm_charts:
-            chart_name = chart.name.lower()
-            if any(keyword in chart_name for keyword in ["python", "py", "flask", "django"]):
-                languages.append("python")
-            if any(keyword in chart_name for keyword in ["node", "js", "express", "react", "angular"]):
-                languages.extend(["javascript", "nodejs"])
-            if any(keyword in chart_name for keyword in ["java", "spring", "tomcat"]):
-                languages.append("java")
-            if any(keyword in chart_name for keyword in ["go", "golang"]):
-                languages.append("go")
-            if any(keyword in chart_name for keyword in ["rust", "rs"]):
-                languages.append("rust")
+        if chart_names is None:
+            chart_names = _chart_names_text(analysis_result)
+        languages.extend(_labels_from_names(chart_names, _LANGUAGE_RULES))
         
-        return list(set(languages))  # Remove duplicates
+        return list(dict.fromkeys(languages))  # Remove duplicates, keeping first-seen order
 
-    def _detect_industries(self, analysis_result: AnalysisResult) -> List[str]:
+    def _detect_industries(self, analysis_result: AnalysisResult, chart_names: Optional[str] = None) -> List[str]:
         """Detect industries this pattern applies to."""
         industries = ["technology", "cloud-computing"]
         
@@ -631,80 +883,153 @@ echo "For more information: https://validatedpatterns.io/patterns/"
                 industries.extend(["data-analytics", "business-intelligence"])
         
         # Add industries based on chart names and functionality
-        for chart in analysis_result.helm_charts:
-            chart_name = chart.name.lower()
-            if any(keyword in chart_name for keyword in ["finance", "banking", "payment"]):
-                industries.append("financial-services")
-            if any(keyword in chart_name for keyword in ["health", "medical", "patient"]):
-                industries.append("healthcare")
-            if any(keyword in chart_name for keyword in ["retail", "ecommerce", "shop"]):
-                industries.append("retail")
-            if any(keyword in chart_name for keyword in ["manufacturing", "iot", "sensor"]):
-                industries.append("manufacturing")
+        if chart_names is None:
+            chart_names = _chart_names_text(analysis_result)
+        industries.extend(_labels_from_names(chart_names, _INDUSTRY_RULES))
         
-        return list(set(industries))  # Remove duplicates
+        return list(dict.fromkeys(industries))  # Remove duplicates, keeping first-seen order
 
     def _generate_platform_overrides(self) -> None:
         """Generate platform-specific override files."""
         # Create platform override files for common platforms
-        platforms = ["AWS", "Azure", "GCP", "IBMCloud", "OpenStack"]
-        
-        for platform in platforms:
-            platform_overrides = f"""\
-# Platform-specific overrides for {platform}
-# Add platform-specific configurations here
+        written = []
+        for platform in _PLATFORMS:
+            name = platform.encode()
+            lower = platform.lower().encode()
+            content = _PLATFORM_OVERRIDE_TEMPLATE % {b"platform": name, b"platform_lower": lower}
+            relative_path = f"overrides/values-{platform}.yaml"
+            self._write_file(relative_path, content)
+            written.append(f"  ✓ Created platform override: {relative_path}")
+        log_info("\n".join(written))
+
+    def _write_file(self, relative_path: str, content: Union[str, bytes], mode: int = 0o666) -> None:
+        """Write content to a file; an explicit mode other than 0o666 is always applied."""
+        self._write_content(relative_path, content, mode)
+        self._record_generated(relative_path)
+
+    def _write_content(self, relative_path: str, content: Union[str, bytes], mode: int = 0o666) -> None:
+        """Write content (text is UTF-8 encoded) to a file without logging it."""
+        file_path = self.pattern_dir / relative_path
+        self._ensure_dir(file_path.parent)
+
+        # Generated files are small, so write them straight to the fd
+        # instead of going through a buffered text wrapper
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        data = memoryview(content)
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            # O_CREAT only applies mode (less umask) to a new file; scripts
+            # regenerated over existing ones must still end up executable
+            if mode != 0o666:
+                if hasattr(os, "fchmod"):
+                    os.fchmod(fd, mode)
+                else:
+                    os.chmod(file_path, mode)
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    def _record_generated(self, relative_path: str) -> None:
+        """Log a written file, or collect it for the generate() summary."""
+        step_generated = getattr(self._local, "generated", None)
+        if step_generated is not None:
+            step_generated.append(relative_path)
+        elif self._generated is not None:
+            self._generated.append(relative_path)
+        else:
+            log_info(f"  ✓ Generated: {relative_path}")
 
-global:
-  clusterPlatform: {platform.lower()}
-  
-# Example platform-specific configurations:
-# storageClass: {platform.lower()}-storage
-# domainSuffix: {platform.lower()}.example.com
-"""
-            self._write_file(f"overrides/values-{platform}.yaml", platform_overrides)
-            log_info(f"  ✓ Created platform override: overrides/values-{platform}.yaml")
+    def _render_and_write(self, relative_path: str, template: str, context: Dict[str, Any], mode: int = 0o666) -> None:
+        """Render a Jinja2 template and write to file."""
+        self._render_to_file(relative_path, template, context, mode)
+        self._record_generated(relative_path)
 
-    def _write_file(self, relative_path: str, content: str) -> None:
-        """Write content to a file."""
-        file_path = self.pattern_dir / relative_path
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+    def _render_and_write_all(self, jobs: List[Tuple[Any, ...]]) -> None:
+        """Render and write independent (path, template, context) jobs.
 
-        with open(file_path, 'w') as f:
-            f.write(content)
+        A job may also carry the mode and suffix arguments of _render_to_file.
 
-        log_info(f"  ✓ Generated: {relative_path}")
+        The jobs are rendered one after another; callers already run on
+        the _run_steps thread pool. Files are recorded in job order.
+        """
+        for job in jobs:
+            self._record_generated(self._render_to_file(*job))
 
-    def _render_and_write(self, relative_path: str, template: str, context: Dict[str, Any]) -> None:
-        """Render a Jinja2 template and write to file."""
+    def _render_to_file(self, relative_path: str, template: str, context: Dict[str, Any],
+                        mode: int = 0o666, suffix: str = "") -> str:
+        """Render a Jinja2 template into a file and return its relative path.
+
+        suffix is text written after the rendered template.
+        """
         try:
-            jinja_template = self.env.from_string(template)
+            jinja_template = self._compile_template(template)
             rendered = jinja_template.render(**context)
-            self._write_file(relative_path, rendered)
+            self._write_content(relative_path, rendered + suffix, mode)
         except Exception as e:
             log_error(f"Failed to render template for {relative_path}: {e}")
             raise
+        return relative_path
+
+    @property
+    def env(self) -> "Environment":
+        """Shared Jinja2 environment used to compile templates."""
+        return _jinja_environment()
+
+    def _compile_template(self, template: str) -> Union["Template", _FormatTemplate]:
+        """Return the compiled template for a template string."""
+        jinja_template = self._template_cache.get(template)
+        if jinja_template is None:
+            # Plain substitution templates skip Jinja2 entirely
+            jinja_template = _FormatTemplate.from_source(template)
+            if jinja_template is not None:
+                self._template_cache[template] = jinja_template
+                return jinja_template
+
+            name = _TEMPLATE_NAMES.get(template)
+            if name is not None:
+                jinja_template = self.env.get_template(name)
+            else:
+                jinja_template = self.env.from_string(template)
+            self._template_cache[template] = jinja_template
+        return jinja_template
 
     def add_custom_values(self, values_file: str, custom_values: Dict[str, Any]) -> None:
         """Add custom values to a values file."""
         file_path = self.pattern_dir / values_file
 
         if file_path.exists():
-            existing_values = yaml.safe_load(file_path.read_text()) or {}
-            # Deep merge custom values
-            merged_values = self._deep_merge(existing_values, custom_values)
+            import yaml
+            # Stream the file to the loader rather than reading it whole
+            with open(file_path, 'rb') as f:
+                existing_values = yaml.load(f, Loader=YAML_LOADER) or {}
+            # Deep merge custom values; existing_values was just loaded, so
+            # it can be merged in place
+            merged_values = self._deep_merge(existing_values, custom_values, inplace=True)
             write_yaml(merged_values, file_path)
             log_info(f"  ✓ Updated {values_file} with custom values")
         else:
             log_warn(f"Values file not found: {values_file}")
 
-    def _deep_merge(self, base: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
-        """Deep merge two dictionaries."""
-        result = base.copy()
-
-        for key, value in update.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
+    def _deep_merge(self, base: Dict[str, Any], update: Dict[str, Any], inplace: bool = False) -> Dict[str, Any]:
+        """Deep merge two dictionaries.
+
+        Unless inplace is set, base is left untouched: only the dicts along
+        merged paths are copied.
+        """
+        result = base if inplace else base.copy()
+
+        stack = [(result, update)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                existing = target.get(key)
+                if isinstance(existing, dict) and isinstance(value, dict):
+                    if not inplace:
+                        existing = target[key] = existing.copy()
+                    stack.append((existing, value))
+                else:
+                    target[key] = value
 
         return result
\ No newline at end of file
@@ -5,12 +5,49 @@ This module analyzes Makefiles found in Helm directories to understand
 the deployment process and generate flow diagrams.
 """
 
+import codecs
+import functools
+import hashlib
+import io
+import json
+import locale
+import mmap
+import os
 import re
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple, Any
-from dataclasses import dataclass, field
-
-from .utils import log_info, log_warn, console
+from typing import (
+    Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Pattern, Set, Tuple
+)
+from dataclasses import dataclass, field, fields
+
+from .models import DATACLASS_SLOTS
+from .utils import (
+    log_info, log_warn, console, buffered_logs, print_logs,
+    CACHE_ROOT, cache_enabled, prune_cache, touch_cache_file,
+)
+
+# Parsed Makefiles are cached here as JSON, keyed by a hash of their
+# content. Bump _PARSE_CACHE_VERSION whenever _parse_makefile's output changes.
+MAKEFILE_CACHE_DIR = CACHE_ROOT / "makefile-ast"
+_PARSE_CACHE_VERSION = 4
+
+# Starting worker processes only pays off for this much Makefile text
+_PARALLEL_MIN_BYTES = 1 << 20
+
+# google-re2 is optional; without it the recipe scan patterns use the
+# stdlib engine. Its \b, \w and \s are ASCII-only, which only matters for
+# commands with non-ASCII text.
+try:
+    import re2 as scan_re
+    RE2_AVAILABLE = True
+except ImportError:
+    scan_re = re
+    RE2_AVAILABLE = False
 
 # Import variable expander
 try:
@@ -20,7 +57,14 @@ except ImportError:
     VARIABLE_EXPANSION_AVAILABLE = False
 
 
-@dataclass
+class _ScanPatterns(NamedTuple):
+    """Compiled recipe scan patterns, see MakefileAnalyzer._scan_patterns()."""
+    tools: Dict[str, Pattern[str]]
+    scripts: List[Pattern[str]]
+    command_screen: Pattern[str]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class MakefileTarget:
     """Represents a Makefile target with its dependencies and commands."""
     name: str
@@ -34,9 +78,23 @@ class MakefileTarget:
     uses_helm: bool = False
     uses_kubectl: bool = False
     uses_oc: bool = False
+    # Lowercased name, for the keyword checks on deployment targets
+    name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.name_lower = self.name.lower()
+
+
+# MakefileTarget fields stored in the parse cache; name_lower is rebuilt
+_TARGET_FIELDS = tuple(f.name for f in fields(MakefileTarget) if f.init)
+
+
+def _target_fields(target: MakefileTarget) -> Dict[str, Any]:
+    """Return the cached fields of target as a JSON-serializable dict."""
+    return {name: getattr(target, name) for name in _TARGET_FIELDS}
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MakefileAnalysis:
     """Results from Makefile analysis."""
     path: Path
@@ -64,25 +122,52 @@ class MakefileAnalyzer:
     INSTALL_KEYWORDS = ['install', 'deploy', 'apply', 'setup', 'bootstrap', 'init']
     UNINSTALL_KEYWORDS = ['uninstall', 'undeploy', 'remove', 'cleanup', 'destroy', 'delete']
 
-    # Common tool patterns
+    # The keyword lists as single alternations, matching the same
+    # substrings of a lowercased target name in one search
+    INSTALL_KEYWORD_RE = re.compile('|'.join(INSTALL_KEYWORDS))
+    UNINSTALL_KEYWORD_RE = re.compile('|'.join(UNINSTALL_KEYWORDS))
+    DEPLOYMENT_KEYWORD_RE = re.compile('|'.join(INSTALL_KEYWORDS + UNINSTALL_KEYWORDS))
+
+    # Common tool patterns. Case is ignored with a scoped (?i:...) group
+    # rather than re.IGNORECASE so that both engines accept them. The
+    # patterns are compiled on first use by _scan_patterns().
     TOOL_PATTERNS = {
-        'helm': re.compile(r'\b(helm)\s+(install|upgrade|delete|uninstall|template)', re.IGNORECASE),
-        'kubectl': re.compile(r'\b(kubectl)\s+(apply|create|delete|patch)', re.IGNORECASE),
-        'oc': re.compile(r'\b(oc)\s+(apply|create|delete|new-app|process)', re.IGNORECASE),
-        'kustomize': re.compile(r'\b(kustomize)\s+(build|edit)', re.IGNORECASE),
-        'argocd': re.compile(r'\b(argocd)\s+(app|repo|cluster)', re.IGNORECASE),
-        'ansible': re.compile(r'\b(ansible-playbook|ansible)', re.IGNORECASE),
-        'make': re.compile(r'\b(make)\s+(-C\s+)?(\S+)', re.IGNORECASE),
+        'helm': r'(?i:\b(helm)\s+(install|upgrade|delete|uninstall|template))',
+        'kubectl': r'(?i:\b(kubectl)\s+(apply|create|delete|patch))',
+        'oc': r'(?i:\b(oc)\s+(apply|create|delete|new-app|process))',
+        'kustomize': r'(?i:\b(kustomize)\s+(build|edit))',
+        'argocd': r'(?i:\b(argocd)\s+(app|repo|cluster))',
+        'ansible': r'(?i:\b(ansible-playbook|ansible))',
+        'make': r'(?i:\b(make)\s+(-C\s+)?(\S+))',
     }
 
-    # Script call patterns
+    # Script call patterns; the script name is the last group
     SCRIPT_PATTERNS = [
-        re.compile(r'\./([\w\-\.]+\.sh)'),  # ./script.sh
-        re.compile(r'bash\s+([\w\-\.\/]+\.sh)'),  # bash script.sh
-        re.compile(r'sh\s+([\w\-\.\/]+\.sh)'),  # sh script.sh
-        re.compile(r'\$\(?(PWD|ROOT_DIR|SCRIPT_DIR)[^\)]*\)?\/([\w\-\.\/]+\.sh)'),  # $(PWD)/script.sh
+        r'\./([\w\-\.]+\.sh)',  # ./script.sh
+        r'bash\s+([\w\-\.\/]+\.sh)',  # bash script.sh
+        r'sh\s+([\w\-\.\/]+\.sh)',  # sh script.sh
+        r'\$\(?(PWD|ROOT_DIR|SCRIPT_DIR)[^\)]*\)?\/([\w\-\.\/]+\.sh)',  # $(PWD)/script.sh
     ]
 
+    # Substrings every match needs: each tool pattern contains one of these
+    # names (compared lowercased, as the patterns ignore case) and each
+    # script pattern contains '.sh'
+    TOOL_SNIFF = ('helm', 'kubectl', 'oc', 'kustomize', 'argocd', 'ansible', 'make')
+
+    # MakefileTarget flag set when a command uses the tool
+    TOOL_FLAGS = {'helm': 'uses_helm', 'kubectl': 'uses_kubectl', 'oc': 'uses_oc'}
+
+    # Assignment operators, in the order _parse_variable tries them
+    ASSIGNMENT_OPERATORS = ['::=', ':=', '!=', '?=', '+=', '=']
+
+    # A line defines a variable if it has any operator other than plain '=',
+    # or a plain '=' with no ':' before it (otherwise it is a target with
+    # '=' among its dependencies)
+    VARIABLE_DEFINITION = re.compile(r':=|[!?+]=|^[^:=]*=')
+
+    # Box edge sliced to width for flow diagram boxes
+    BOX_RULE = '─' * 512
+
     # Special targets that GNU Make recognizes
     SPECIAL_TARGETS = ['.PHONY', '.SUFFIXES', '.DEFAULT', '.PRECIOUS', '.INTERMEDIATE',
                       '.SECONDARY', '.SECONDEXPANSION', '.DELETE_ON_ERROR', '.IGNORE',
@@ -97,13 +182,19 @@ class MakefileAnalyzer:
         self._in_define = False
         self._define_var = None
         self._conditional_stack = []
+        # Number of False entries in _conditional_stack
+        self._false_count = 0
 
     def analyze(self, verbose: bool = False) -> MakefileAnalysis:
         """Analyze the Makefile and trace through dependencies."""
         log_info(f"Analyzing Makefile: {self.makefile_path}")
 
-        # Parse the Makefile
-        self._parse_makefile()
+        # Parse the Makefile, unless this content was parsed before
+        with self._map_makefile() as data:
+            cache_file = self._cache_file(data)
+            if not self._load_parse_cache(cache_file):
+                self._parse_makefile(data)
+                self._save_parse_cache(cache_file)
 
         # Detect deployment tools
         self._detect_tools()
@@ -127,9 +218,139 @@ class MakefileAnalyzer:
 
         return self.analysis
 
-    def _parse_makefile(self) -> None:
+    @classmethod
+    def analyze_many(cls, paths: List[Path], verbose: bool = False) -> List[Optional[MakefileAnalysis]]:
+        """Analyze several Makefiles, in parallel worker processes if they are large.
+
+        Returns the analyses in the order of paths, with None for a
+        Makefile whose analysis failed. Each Makefile's log lines are
+        printed together, in the order of paths.
+        """
+        if len(paths) >= 2 and cls._total_size(paths) >= _PARALLEL_MIN_BYTES:
+            workers = min(len(paths), os.cpu_count() or 1)
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    outcomes = list(executor.map(_analyze_one, paths, [verbose] * len(paths)))
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                # Some sandboxes cannot start processes
+                log_warn(f"Parallel Makefile analysis unavailable ({e}), analyzing sequentially")
+            else:
+                results = []
+                for analysis, lines in outcomes:
+                    print_logs(lines)
+                    results.append(analysis)
+                return results
+
+        results = []
+        for path in paths:
+            analysis, lines = _analyze_one(path, verbose)
+            print_logs(lines)
+            results.append(analysis)
+        return results
+
+    @staticmethod
+    def _total_size(paths: List[Path]) -> int:
+        """Total size in bytes of the files at paths; unreadable ones count as 0."""
+        total = 0
+        for path in paths:
+            try:
+                total += os.stat(path).st_size
+            except OSError:
+                pass
+        return total
+
+    def _cache_file(self, data: Optional[mmap.mmap]) -> Optional[Path]:
+        """Return the parse cache file for the Makefile content data."""
+        if data is None or not cache_enabled():
+            return None
+        digest = hashlib.sha256(data).hexdigest()
+        # The regex engine can change what the recipe scan finds
+        engine = "-re2" if RE2_AVAILABLE else ""
+        return MAKEFILE_CACHE_DIR / f"{digest}-v{_PARSE_CACHE_VERSION}{engine}.json"
+
+    def _load_parse_cache(self, cache_file: Optional[Path]) -> bool:
+        """Restore the parse results from cache_file, if it can be read."""
+        if cache_file is None:
+            return False
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                parsed = json.load(f)
+            targets = {
+                name: MakefileTarget(**target)
+                for name, target in parsed["targets"].items()
+            }
+            pattern_rules = [MakefileTarget(**target) for target in parsed["pattern_rules"]]
+            variables = dict(parsed["variables"])
+            includes = list(parsed["includes"])
+            detected_tools = set(parsed["detected_tools"])
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            # Unreadable or malformed entries are reparsed and overwritten
+            return False
+
+        touch_cache_file(cache_file)
+        self.analysis.targets = targets
+        self.analysis.pattern_rules = pattern_rules
+        self.analysis.variables = variables
+        self.analysis.includes = includes
+        self.analysis.detected_tools = detected_tools
+        return True
+
+    def _save_parse_cache(self, cache_file: Optional[Path]) -> None:
+        """Store the parse results in cache_file; failures are ignored."""
+        if cache_file is None:
+            return
+        parsed = {
+            "targets": {
+                name: _target_fields(target)
+                for name, target in self.analysis.targets.items()
+            },
+            "pattern_rules": [_target_fields(target) for target in self.analysis.pattern_rules],
+            "variables": self.analysis.variables,
+            "includes": self.analysis.includes,
+            "detected_tools": sorted(self.analysis.detected_tools),
+        }
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename it into place, so a
+            # concurrent run never reads a partial entry
+            fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(parsed, f)
+                os.replace(tmp_name, cache_file)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            return
+        prune_cache(cache_file.parent)
+
+    @contextmanager
+    def _map_makefile(self) -> Iterator[Optional[mmap.mmap]]:
+        """Memory-map the Makefile for reading.
+
+        Yields None if the file cannot be mapped (e.g. it is empty or
+        missing); the parser then reads it as text.
+        """
+        try:
+            f = open(self.makefile_path, 'rb')
+        except OSError:
+            yield None
+            return
+        with f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                yield None
+                return
+            with mm:
+                yield mm
+
+    def _parse_makefile(self, data: Optional[mmap.mmap] = None) -> None:
         """Parse Makefile content into targets, variables, and includes.
 
+        data is the file mapped by _map_makefile(), if the caller mapped it.
+
         Handles GNU Make features including:
         - Line continuations with backslash
         - Pattern rules (%.o: %.c)
@@ -138,87 +359,76 @@ class MakefileAnalyzer:
         - Multi-line variable definitions (define...endef)
         - Include directives
         """
-        with open(self.makefile_path, 'r') as f:
-            lines = f.readlines()
+        if data is None:
+            text = self.makefile_path.read_text()
+            if text.endswith('\n'):
+                text = text[:-1]
+            lines: Iterable[str] = text.split('\n')
+        else:
+            lines = self._decoded_lines(data)
 
         current_target = None
         in_recipe = False
-        continued_line = ""
-        i = 0
-
-        while i < len(lines):
-            # Handle line continuations
-            line = lines[i].rstrip('\n')
+        command_screen = self._scan_patterns().command_screen
 
-            # Accumulate continued lines
-            while line.endswith('\\') and i + 1 < len(lines):
-                continued_line += line[:-1] + ' '
-                i += 1
-                line = lines[i].rstrip('\n')
-
-            # Add the final line (or the only line if no continuation)
-            full_line = continued_line + line
-            continued_line = ""
+        for full_line in self._logical_lines(lines):
+            # Each line is stripped once; the checks below test the result
+            stripped = full_line.strip()
 
             # Skip empty lines
-            if not full_line.strip():
-                i += 1
+            if not stripped:
                 continue
 
             # Handle multi-line variable definitions (define...endef)
-            if full_line.strip().startswith('define '):
-                self._define_var = full_line.strip().split()[1]
+            if stripped.startswith('define '):
+                self._define_var = sys.intern(stripped.split(None, 2)[1])
                 self._in_define = True
                 self.analysis.variables[self._define_var] = ""
-                i += 1
                 continue
 
             if self._in_define:
-                if full_line.strip() == 'endef':
+                if stripped == 'endef':
                     self._in_define = False
                     self._define_var = None
                 else:
                     if self._define_var:  # Only append if we have a valid variable name
                         self.analysis.variables[self._define_var] += full_line + '\n'
-                i += 1
                 continue
 
             # Handle comments (but check for target descriptions)
-            if full_line.strip().startswith('#'):
+            if stripped.startswith('#'):
                 if current_target and not in_recipe and not current_target.description:
-                    desc = full_line.strip().lstrip('#').strip()
+                    desc = stripped.lstrip('#').strip()
                     if desc:
                         current_target.description = desc
-                i += 1
+                continue
+
+            # Inside a false branch only conditional directives matter
+            if self._false_count and not stripped.startswith(('if', 'else', 'endif')):
                 continue
 
             # Handle conditional directives
-            if self._handle_conditional(full_line):
-                i += 1
+            if self._handle_conditional(stripped):
                 continue
 
             # Skip if we're in a false conditional branch
             if self._in_false_conditional():
-                i += 1
                 continue
 
             # Variable definitions
             if self._is_variable_definition(full_line):
                 self._parse_variable(full_line)
-                i += 1
                 continue
 
             # Include directives
-            if full_line.strip().startswith(('include', '-include', 'sinclude')):
-                parts = full_line.strip().split(None, 1)
-                if len(parts) > 1:
-                    self.analysis.includes.extend(parts[1].split())
-                i += 1
+            if stripped.startswith(('include', '-include', 'sinclude')):
+                # Everything after the directive word is a file name
+                self.analysis.includes.extend(stripped.split()[1:])
                 continue
 
             # Special targets
-            if full_line.strip().startswith('.PHONY:'):
-                phony_targets = full_line.split(':', 1)[1].strip().split()
+            if stripped.startswith('.PHONY:'):
+                phony_targets = [sys.intern(name) for name in stripped[len('.PHONY:'):].split()]
                 for target_name in phony_targets:
                     if target_name in self.analysis.targets:
                         self.analysis.targets[target_name].is_phony = True
@@ -226,48 +436,119 @@ class MakefileAnalyzer:
                         # Create placeholder for phony targets we haven't seen yet
                         target = MakefileTarget(name=target_name, is_phony=True)
                         self.analysis.targets[target_name] = target
-                i += 1
                 continue
 
+            is_recipe_line = full_line.startswith('\t')
+
             # Target definitions (including pattern rules and double-colon rules)
-            if self._is_target_definition(full_line) and not full_line.startswith('\t'):
+            if not is_recipe_line and self._is_target_definition(full_line):
                 target_info = self._parse_target_line(full_line)
                 if target_info:
                     current_target = target_info
                     in_recipe = True
-                i += 1
                 continue
 
             # Recipe commands
-            if full_line.startswith('\t') and current_target:
+            if is_recipe_line and current_target:
                 command = full_line[1:]  # Remove leading tab
-                if command.strip():
-                    # Remove @ prefix if present
-                    if command.strip().startswith('@'):
-                        command = command.strip()[1:]
-                    current_target.commands.append(command)
-
-                    # Check for script calls
-                    for pattern in self.SCRIPT_PATTERNS:
-                        match = pattern.search(command)
-                        if match:
-                            script_name = match.group(1) if match.lastindex == 1 else match.group(2)
-                            current_target.calls_scripts.append(script_name)
-
-                    # Check for tool usage
-                    for tool, pattern in self.TOOL_PATTERNS.items():
-                        if pattern.search(command):
-                            if tool == 'helm':
-                                current_target.uses_helm = True
-                            elif tool == 'kubectl':
-                                current_target.uses_kubectl = True
-                            elif tool == 'oc':
-                                current_target.uses_oc = True
-                            self.analysis.detected_tools.add(tool)
+                # Remove @ prefix if present
+                if stripped.startswith('@'):
+                    command = stripped[1:]
+                current_target.commands.append(command)
+
+                # Most commands call no script and no known tool
+                if self._may_use_tool(command) and command_screen.search(command):
+                    self._scan_command(current_target, command)
             else:
                 in_recipe = False
 
-            i += 1
+    @staticmethod
+    def _decoded_lines(data: mmap.mmap) -> Iterator[str]:
+        """Yield the lines of data, without line endings, one at a time.
+
+        Lines are decoded as open() in text mode would: default encoding
+        and universal newlines.
+        """
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(locale.getpreferredencoding(False))(),
+            translate=True)
+        pending = ''
+        for raw in iter(data.readline, b''):
+            *lines, pending = (pending + decoder.decode(raw)).split('\n')
+            yield from lines
+        *lines, pending = (pending + decoder.decode(b'', final=True)).split('\n')
+        yield from lines
+        if pending:
+            yield pending
+
+    @staticmethod
+    def _logical_lines(lines: Iterable[str]) -> Iterator[str]:
+        """Join backslash continuations in Makefile lines.
+
+        Each continued line loses its backslash and is joined to the next
+        with a space. A backslash on the file's last line is kept.
+        """
+        parts = []
+        for line in lines:
+            if line.endswith('\\'):
+                parts.append(line[:-1])
+                continue
+            if parts:
+                parts.append(line)
+                line = ' '.join(parts)
+                parts = []
+            yield line
+        if parts:
+            # The last line was continued: it keeps its backslash
+            parts[-1] += '\\'
+            yield ' '.join(parts)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _scan_patterns() -> "_ScanPatterns":
+        """Compile the recipe scan patterns, once per process."""
+        tools = {tool: scan_re.compile(source)
+                 for tool, source in MakefileAnalyzer.TOOL_PATTERNS.items()}
+        scripts = [scan_re.compile(source) for source in MakefileAnalyzer.SCRIPT_PATTERNS]
+        # Union of the tool and script patterns. A single alternation cannot
+        # report overlapping matches ("bash x.sh" is matched by both the bash
+        # and sh patterns), so it only screens commands: the individual
+        # patterns run only when it finds something.
+        command_screen = scan_re.compile("|".join(
+            list(MakefileAnalyzer.TOOL_PATTERNS.values()) +
+            [f"(?:{source})" for source in MakefileAnalyzer.SCRIPT_PATTERNS]
+        ))
+        return _ScanPatterns(tools, scripts, command_screen)
+
+    @classmethod
+    def _may_use_tool(cls, command: str) -> bool:
+        """Cheap substring check that rules out most commands before the screen."""
+        if '.sh' in command:
+            return True
+        if not command.isascii():
+            # Case-insensitive matching pairs some non-ASCII letters with
+            # ASCII ones (e.g. dotless i), which lower() does not
+            return True
+        lowered = command.lower()
+        return any(token in lowered for token in cls.TOOL_SNIFF)
+
+    def _scan_command(self, target: MakefileTarget, command: str) -> None:
+        """Record the scripts and deployment tools a recipe command uses."""
+        # Check for script calls
+        patterns = self._scan_patterns()
+        for pattern in patterns.scripts:
+            match = pattern.search(command)
+            if match:
+                script_name = match.groups()[-1]
+                target.calls_scripts.append(script_name)
+
+        # Check for tool usage
+        for tool, pattern in patterns.tools.items():
+            if pattern.search(command):
+                flag = self.TOOL_FLAGS.get(tool)
+                if flag:
+                    setattr(target, flag, True)
+                self.analysis.detected_tools.add(tool)
 
     def _is_variable_definition(self, line: str) -> bool:
         """Check if a line is a variable definition.
@@ -278,21 +559,8 @@ class MakefileAnalyzer:
         # Skip lines that start with tab (these are commands)
         if line.startswith('\t'):
             return False
-        
-        # Check for specific assignment operators in order of precedence
-        for op in ['::=', ':=', '!=', '?=', '+=', '=']:
-            if op in line:
-                # For plain '=' we need to distinguish from target definitions
-                if op == '=' and ':' in line:
-                    # Check if the ':' comes before the '='
-                    colon_pos = line.find(':')
-                    equals_pos = line.find('=')
-                    if colon_pos < equals_pos and colon_pos != -1:
-                        # This looks like a target definition with = in the dependencies
-                        continue
-                return True
-        
-        return False
+
+        return self.VARIABLE_DEFINITION.search(line) is not None
 
     def _is_target_definition(self, line: str) -> bool:
         """Check if a line is a target definition.
@@ -316,25 +584,21 @@ class MakefileAnalyzer:
     def _parse_target_line(self, line: str) -> Optional[MakefileTarget]:
         """Parse a target line and return a MakefileTarget object."""
         # Check for double-colon rule
-        is_double_colon = '::' in line and not ':::' in line
+        target_part, sep, deps_part = line.partition('::')
+        is_double_colon = bool(sep) and ':::' not in line
 
-        if is_double_colon:
-            parts = line.split('::', 1)
-        else:
-            parts = line.split(':', 1)
-
-        if len(parts) < 2:
-            return None
-
-        target_part = parts[0].strip()
-        deps_part = parts[1].strip() if len(parts) > 1 else ""
+        if not is_double_colon:
+            target_part, sep, deps_part = line.partition(':')
+            if not sep:
+                return None
 
         # Check if it's a pattern rule
         is_pattern = '%' in target_part
 
-        # Parse multiple targets
-        targets = target_part.split()
-        dependencies = deps_part.split() if deps_part else []
+        # Parse multiple targets; names are interned since the same names
+        # key the target dict and recur across dependency lists
+        targets = [sys.intern(name) for name in target_part.split()]
+        dependencies = [sys.intern(dep) for dep in deps_part.split()]
 
         # Create target object(s)
         for target_name in targets:
@@ -359,10 +623,11 @@ class MakefileAnalyzer:
         # Return the last target created (for setting as current_target)
         return target
 
-    def _handle_conditional(self, line: str) -> bool:
-        """Handle conditional directives (ifeq, ifdef, ifndef, else, endif)."""
-        stripped = line.strip()
+    def _handle_conditional(self, stripped: str) -> bool:
+        """Handle conditional directives (ifeq, ifdef, ifndef, else, endif).
 
+        stripped is the line without surrounding whitespace.
+        """
         if stripped.startswith(('ifeq', 'ifneq', 'ifdef', 'ifndef')):
             # For now, we'll assume all conditionals are true
             # A full implementation would need to evaluate the conditions
@@ -370,18 +635,21 @@ class MakefileAnalyzer:
             return True
         elif stripped == 'else':
             if self._conditional_stack:
-                self._conditional_stack[-1] = not self._conditional_stack[-1]
+                branch = not self._conditional_stack[-1]
+                self._conditional_stack[-1] = branch
+                self._false_count += -1 if branch else 1
             return True
         elif stripped == 'endif':
             if self._conditional_stack:
-                self._conditional_stack.pop()
+                if not self._conditional_stack.pop():
+                    self._false_count -= 1
             return True
 
         return False
 
     def _in_false_conditional(self) -> bool:
         """Check if we're currently in a false conditional branch."""
-        return any(not cond for cond in self._conditional_stack)
+        return self._false_count > 0
 
     def _parse_variable(self, line: str) -> None:
         """Parse variable definition from line.
@@ -395,11 +663,11 @@ class MakefileAnalyzer:
         !=  Shell assignment
         """
         # Find the assignment operator
-        for op in ['::=', ':=', '!=', '?=', '+=', '=']:
+        for op in self.ASSIGNMENT_OPERATORS:
             if op in line:
                 parts = line.split(op, 1)
                 if len(parts) == 2:
-                    var_name = parts[0].strip()
+                    var_name = sys.intern(parts[0].strip())
                     var_value = parts[1].strip()
 
                     if op == '+=':
@@ -428,19 +696,19 @@ class MakefileAnalyzer:
         uninstall_candidates = []
 
         for target_name, target in self.analysis.targets.items():
-            lower_name = target_name.lower()
+            lower_name = target.name_lower
 
             # Skip pattern rules for this analysis
             if target.is_pattern_rule:
                 continue
 
             # Check for install targets
-            if any(keyword in lower_name for keyword in self.INSTALL_KEYWORDS):
+            if self.INSTALL_KEYWORD_RE.search(lower_name):
                 self.analysis.has_install_target = True
                 install_candidates.append(target_name)
 
             # Check for uninstall targets
-            if any(keyword in lower_name for keyword in self.UNINSTALL_KEYWORDS):
+            if self.UNINSTALL_KEYWORD_RE.search(lower_name):
                 self.analysis.has_uninstall_target = True
                 uninstall_candidates.append(target_name)
 
@@ -466,8 +734,8 @@ class MakefileAnalyzer:
         if not flow_list:
             # Find the most likely target
             for keyword in (self.INSTALL_KEYWORDS if target_type == 'install' else self.UNINSTALL_KEYWORDS):
-                for target_name in self.analysis.targets:
-                    if keyword in target_name.lower():
+                for target_name, target in self.analysis.targets.items():
+                    if keyword in target.name_lower:
                         flow_list.append(target_name)
                         break
                 if flow_list:
@@ -475,31 +743,28 @@ class MakefileAnalyzer:
 
         # Trace dependencies
         if flow_list:
-            self._trace_dependencies(flow_list[0], flow_list, set())
-
-    def _trace_dependencies(self, target_name: str, flow_list: List[str], visited: Set[str]) -> None:
-        """Recursively trace target dependencies."""
-        if target_name in visited:
-            return
-
-        visited.add(target_name)
+            order: List[str] = []
+            self._trace_dependencies(flow_list[0], order, set(flow_list))
+            flow_list[:] = order + flow_list[1:]
 
-        if target_name not in self.analysis.targets:
-            return
+    def _trace_dependencies(self, target_name: str, order: List[str], seen: Set[str]) -> None:
+        """Append target_name to order after its dependencies (post-order).
 
-        target = self.analysis.targets[target_name]
+        seen holds the targets already placed or being traced; each
+        dependency is traced once, before the targets that need it.
+        """
+        target = self.analysis.targets.get(target_name)
+        if target is not None:
+            for dep in target.dependencies:
+                # Skip automatic variables and pattern rules
+                if dep.startswith('$') or '%' in dep:
+                    continue
 
-        # Add dependencies first (they execute before the target)
-        for dep in target.dependencies:
-            # Skip automatic variables and pattern rules
-            if dep.startswith('$') or '%' in dep:
-                continue
+                if dep not in seen and dep in self.analysis.targets:
+                    seen.add(dep)
+                    self._trace_dependencies(dep, order, seen)
 
-            if dep not in flow_list and dep in self.analysis.targets:
-                # Insert dependencies before the current target
-                insert_index = flow_list.index(target_name)
-                flow_list.insert(insert_index, dep)
-                self._trace_dependencies(dep, flow_list, visited)
+        order.append(target_name)
 
     def _analyze_called_scripts(self) -> None:
         """Analyze scripts called from Makefile targets."""
@@ -578,11 +843,9 @@ class MakefileAnalyzer:
         if not flow:
             return f"No {target_type} targets found in Makefile"
 
-        # Build the diagram
-        diagram = []
-        diagram.append(f"\n{title}")
-        diagram.append("=" * len(title))
-        diagram.append("")
+        # Build the diagram; every line after the first starts with "\n"
+        out = io.StringIO()
+        out.write(f"\n{title}\n{'=' * len(title)}\n")
 
         # Show the main flow
         for i, target_name in enumerate(flow):
@@ -600,25 +863,23 @@ class MakefileAnalyzer:
             if target.description:
                 box_content += f" - {target.description}"
 
-            diagram.append(f"┌{'─' * (len(box_content) + 2)}┐")
-            diagram.append(f"│ {box_content} │")
-            diagram.append(f"└{'─' * (len(box_content) + 2)}┘")
+            rule = MakefileAnalyzer._box_rule(len(box_content) + 2)
+            out.write(f"\n┌{rule}┐\n│ {box_content} │\n└{rule}┘")
 
             # Show key commands
             if target.commands:
-                diagram.append("  │")
-                for cmd in target.commands[:3]:  # Show first 3 commands
+                out.write("\n  │")
+                shown = target.commands[:3]  # Show first 3 commands
+                for j, cmd in enumerate(shown):
                     # Simplify command for display
                     if len(cmd) > 60:
                         cmd = cmd[:57] + "..."
-                    diagram.append(f"  ├─> {cmd}")
+                    # The last line of the branch gets a closing corner
+                    last = j == len(shown) - 1 and len(target.commands) <= 3
+                    out.write(f"\n  {'└' if last else '├'}─> {cmd}")
 
                 if len(target.commands) > 3:
-                    diagram.append(f"  └─> ... ({len(target.commands) - 3} more commands)")
-                else:
-                    # Change last ├ to └
-                    if diagram[-1].startswith("  ├"):
-                        diagram[-1] = diagram[-1].replace("├", "└", 1)
+                    out.write(f"\n  └─> ... ({len(target.commands) - 3} more commands)")
 
             # Show tools used
             tools = []
@@ -630,18 +891,24 @@ class MakefileAnalyzer:
                 tools.append("oc")
 
             if tools:
-                diagram.append(f"      Tools: {', '.join(tools)}")
+                out.write(f"\n      Tools: {', '.join(tools)}")
 
             # Show called scripts
             if target.calls_scripts:
-                diagram.append(f"      Scripts: {', '.join(target.calls_scripts)}")
+                out.write(f"\n      Scripts: {', '.join(target.calls_scripts)}")
 
             # Arrow to next target
             if i < len(flow) - 1:
-                diagram.append("  │")
-                diagram.append("  ▼")
+                out.write("\n  │\n  ▼")
+
+        return out.getvalue()
 
-        return '\n'.join(diagram)
+    @staticmethod
+    def _box_rule(width: int) -> str:
+        """Horizontal box edge of the given width."""
+        if width <= len(MakefileAnalyzer.BOX_RULE):
+            return MakefileAnalyzer.BOX_RULE[:width]
+        return '─' * width
 
     def print_analysis(self) -> None:
         """Print formatted analysis results."""
@@ -684,7 +951,7 @@ class MakefileAnalyzer:
         # Key targets
         console.print("\n[cyan]Key Targets:[/cyan]")
         for target_name, target in self.analysis.targets.items():
-            if any(kw in target_name.lower() for kw in self.INSTALL_KEYWORDS + self.UNINSTALL_KEYWORDS):
+            if self.DEPLOYMENT_KEYWORD_RE.search(target.name_lower):
                 console.print(f"  • {target_name}", end="")
                 if target.description:
                     console.print(f" - {target.description}", end="")
@@ -733,4 +1000,18 @@ class MakefileAnalyzer:
             console.print(self.generate_flow_diagram('install'))
 
         if self.analysis.has_uninstall_target:
-            console.print(self.generate_flow_diagram('uninstall'))
\ No newline at end of file
+            console.print(self.generate_flow_diagram('uninstall'))
+
+
+def _analyze_one(path: Path, verbose: bool = False) -> Tuple[Optional[MakefileAnalysis], List[str]]:
+    """Analyze one Makefile for MakefileAnalyzer.analyze_many().
+
+    Returns the analysis, or None if it failed, and the log lines it
+    produced, for the caller to print in order.
+    """
+    with buffered_logs() as lines:
+        try:
+            return MakefileAnalyzer(path).analyze(verbose), lines
+        except Exception as e:
+            log_warn(f"Makefile analysis failed for {path}: {e}")
+            return None, lines
@@ -5,28 +5,65 @@ This module handles the migration of Helm charts from source
 repositories to the validated pattern structure.
 """
 
+import os
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
+
+import yaml
 
 from .analyzer import HelmChart, AnalysisResult
 from .generator import PatternGenerator
 from .utils import (
     log_info, log_warn, log_success, log_error,
-    copy_tree, ensure_directory, relative_path,
-    console, run_command, check_command_exists
+    copy_file, copy_tree, ensure_directory, relative_path,
+    console, run_command, check_command_exists, YAML_LOADER, YAML_DUMPER,
+    buffered_logs, print_logs
 )
 
 
 class HelmMigrator:
     """Migrates Helm charts to validated pattern structure."""
 
-    def __init__(self, pattern_dir: Path, generator: PatternGenerator):
-        """Initialize migrator with pattern directory and generator."""
+    # Source chart entries that are not migrated
+    CHART_IGNORE_PATTERNS = [".git", ".gitignore", "*.tgz", ".helmignore"]
+
+    # Script names (lowercased) containing any of these words are migrated
+    USEFUL_SCRIPT_NAME_RE = re.compile('|'.join(map(re.escape, [
+        "deploy", "install", "setup", "test", "validate",
+        "build", "push", "release", "backup", "restore"
+    ])))
+
+    # Scripts whose path contains any of these are never migrated
+    EXCLUDED_SCRIPT_PATH_RE = re.compile('|'.join(map(re.escape, [
+        "node_modules", "venv", ".git", "vendor",
+        "__pycache__", ".pytest_cache"
+    ])))
+
+    # Chart.yaml shapes that _update_chart_metadata can append to: a
+    # top-level block key, the keys it adds, and YAML document markers
+    BLOCK_KEY_RE = re.compile(r'^[\w"\'][^:#\n]*:(?:\s|$)', re.MULTILINE)
+    METADATA_KEY_RE = re.compile(r'^["\']?(?:annotations|maintainers)["\']?\s*:', re.MULTILINE)
+    DOCUMENT_MARKER_RE = re.compile(r'^(?:---|\.\.\.)', re.MULTILINE)
+
+    # Scripts in directories with these names are migrated whatever they are called
+    SCRIPT_DIRECTORY_NAMES = frozenset(["scripts", "bin", "tools"])
+
+    def __init__(self, pattern_dir: Path, generator: PatternGenerator,
+                 link_scripts: bool = False):
+        """Initialize migrator with pattern directory and generator.
+
+        With link_scripts, migrated scripts are hardlinked to the source when
+        both are on one filesystem, so edits to either copy show in both.
+        """
         self.pattern_dir = pattern_dir
         self.generator = generator
+        self.link_scripts = link_scripts
         self.migrated_dir = pattern_dir / "migrated-charts"
         ensure_directory(self.migrated_dir)
+        self._helm_available = check_command_exists("helm")
 
     def migrate_all(self, analysis_result: AnalysisResult) -> int:
         """Migrate all Helm charts found in the analysis."""
@@ -36,23 +73,67 @@ class HelmMigrator:
 
         log_info(f"Starting migration of {len(analysis_result.helm_charts)} Helm charts...")
 
-        migrated_count = 0
-        with console.status("[bold green]Migrating Helm charts...") as status:
-            for i, chart in enumerate(analysis_result.helm_charts, 1):
-                status.update(f"Migrating chart {i}/{len(analysis_result.helm_charts)}: {chart.name}")
+        # The same chart (name and path) listed twice is migrated once
+        unique_charts: Dict[Tuple[str, str], HelmChart] = {}
+        for chart in analysis_result.helm_charts:
+            unique_charts.setdefault((chart.name, str(chart.path)), chart)
+        charts = list(unique_charts.values())
+        migrated = [False] * len(charts)
+        # Each chart's log lines, printed together in chart order
+        chart_logs: List[List[str]] = [[] for _ in charts]
+
+        # Copying is I/O-bound, so charts are migrated on a thread pool.
+        # Charts with the same name share a target directory: only the first
+        # of each name runs concurrently, the others after it, as before.
+        first_indexes: List[int] = []
+        repeat_indexes: List[int] = []
+        seen_names = set()
+        for i, chart in enumerate(charts):
+            (repeat_indexes if chart.name in seen_names else first_indexes).append(i)
+            seen_names.add(chart.name)
 
-                if self.migrate_chart(chart):
+        with console.status("[bold green]Migrating Helm charts...") as status:
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(first_indexes))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self._migrate_chart_buffered, charts[i]): i
+                           for i in first_indexes}
+                for done, future in enumerate(as_completed(futures), 1):
+                    i = futures[future]
+                    status.update(f"Migrated chart {done}/{len(first_indexes)}: {charts[i].name}")
+                    migrated[i], chart_logs[i] = future.result()
+
+            for i in repeat_indexes:
+                migrated[i], chart_logs[i] = self._migrate_chart_buffered(charts[i])
+
+            print_logs([line for lines in chart_logs for line in lines])
+
+            # One helm lint run covers every migrated chart
+            status.update("Linting migrated charts...")
+            self._lint_charts([self.migrated_dir / chart.name
+                               for chart, ok in zip(charts, migrated) if ok])
+
+            # Wrapper charts are generated in chart order
+            migrated_count = 0
+            for chart, ok in zip(charts, migrated):
+                if ok:
                     migrated_count += 1
-
-                    # Generate wrapper chart
                     status.update(f"Creating wrapper for {chart.name}...")
                     self.generator.generate_wrapper_chart(chart)
 
         log_success(f"Successfully migrated {migrated_count} charts")
         return migrated_count
 
-    def migrate_chart(self, chart: HelmChart) -> bool:
-        """Migrate a single Helm chart."""
+    def _migrate_chart_buffered(self, chart: HelmChart) -> Tuple[bool, List[str]]:
+        """Migrate a chart without linting, collecting its log lines."""
+        with buffered_logs() as lines:
+            migrated = self.migrate_chart(chart, lint=False)
+        return migrated, lines
+
+    def migrate_chart(self, chart: HelmChart, lint: bool = True) -> bool:
+        """Migrate a single Helm chart.
+
+        lint=False skips helm lint, for callers that lint charts in a batch.
+        """
         try:
             target_dir = self.migrated_dir / chart.name
 
@@ -63,14 +144,10 @@ class HelmMigrator:
 
             # Copy chart directory
             log_info(f"  Migrating chart: {chart.name}")
-            copy_tree(
-                chart.path,
-                target_dir,
-                ignore_patterns=[".git", ".gitignore", "*.tgz", ".helmignore"]
-            )
+            copy_tree(chart.path, target_dir, ignore_patterns=self.CHART_IGNORE_PATTERNS)
 
             # Validate the migrated chart
-            if self._validate_chart(target_dir):
+            if self._validate_chart(target_dir, lint):
                 log_success(f"    ✓ Chart migrated: migrated-charts/{chart.name}/")
 
                 # Optionally update Chart.yaml with pattern-specific metadata
@@ -97,20 +174,34 @@ class HelmMigrator:
 
         migrated_count = 0
         useful_scripts = self._identify_useful_scripts(analysis_result.script_files)
+        # Target paths are joined as strings rather than with Path's /
+        scripts_dir_str = str(scripts_dir)
 
         for script in useful_scripts:
             try:
-                target_path = scripts_dir / script.name
-                if not target_path.exists():
-                    shutil.copy2(script, target_path)
-                    log_info(f"  ✓ Migrated script: scripts/{script.name}")
+                script_name = script.name
+                target_path = os.path.join(scripts_dir_str, script_name)
+                if not os.path.exists(target_path):
+                    self._copy_script(script, target_path)
+                    log_info(f"  ✓ Migrated script: scripts/{script_name}")
                     migrated_count += 1
             except Exception as e:
                 log_warn(f"  Failed to migrate script {script.name}: {e}")
 
         return migrated_count
 
-    def _validate_chart(self, chart_dir: Path) -> bool:
+    def _copy_script(self, script: Path, target_path: str) -> None:
+        """Hardlink a script into the pattern when enabled, else copy it."""
+        if self.link_scripts:
+            try:
+                os.link(script, target_path)
+                return
+            except OSError:
+                # Cross-device or unsupported filesystem
+                pass
+        copy_file(script, target_path)
+
+    def _validate_chart(self, chart_dir: Path, lint: bool = True) -> bool:
         """Validate a Helm chart structure."""
         # Basic structure validation
         required_files = ["Chart.yaml"]
@@ -120,7 +211,7 @@ class HelmMigrator:
                 return False
 
         # If helm is available, use it for validation
-        if check_command_exists("helm"):
+        if lint and self._helm_available:
             try:
                 result = run_command(
                     ["helm", "lint", str(chart_dir)],
@@ -143,31 +234,87 @@ class HelmMigrator:
 
         return True
 
+    def _lint_charts(self, chart_dirs: List[Path]) -> None:
+        """Run helm lint once over several migrated charts.
+
+        As in _validate_chart, lint findings are reported but never fail a
+        migration.
+        """
+        if not chart_dirs or not self._helm_available:
+            return
+
+        try:
+            result = run_command(
+                ["helm", "lint", *(str(chart_dir) for chart_dir in chart_dirs)],
+                capture_output=True,
+                check=False
+            )
+        except Exception as e:
+            log_warn(f"  Could not run helm lint: {e}")
+            return
+
+        # helm prints a "==> Linting <chart>" section per chart, with
+        # [ERROR] lines for the charts that fail
+        reports = {}
+        for section in result.stdout.split("==> Linting ")[1:]:
+            path, _, report = section.partition("\n")
+            reports[path.strip()] = report.strip()
+
+        for chart_dir in chart_dirs:
+            report = reports.get(str(chart_dir))
+            if report is None:
+                # Output not attributable to the chart: judge by exit status
+                failed, report = result.returncode != 0, result.stdout
+            else:
+                failed = "[ERROR]" in report
+            if failed:
+                log_warn(f"  Helm lint warnings for {chart_dir.name}: {report}")
+            else:
+                log_info(f"  ✓ Helm lint passed: {chart_dir.name}")
+
     def _update_chart_metadata(self, chart_dir: Path, chart: HelmChart) -> None:
         """Update Chart.yaml with pattern-specific metadata."""
         chart_file = chart_dir / "Chart.yaml"
 
         try:
-            import yaml
             with open(chart_file, 'r') as f:
-                chart_data = yaml.safe_load(f)
+                text = f.read()
+
+            annotations = {
+                "validatedpatterns.io/pattern": self.generator.pattern_name,
+                "validatedpatterns.io/migrated": "true"
+            }
+            maintainers = [{
+                "name": "Validated Patterns Team",
+                "email": "validated-patterns@redhat.com"
+            }]
+
+            # The analyzer has already parsed this Chart.yaml as a mapping.
+            # When it is a single block mapping with neither key, the new
+            # keys are appended, keeping the file's own formatting.
+            first_key = self.BLOCK_KEY_RE.search(text)
+            if (first_key and not self.METADATA_KEY_RE.search(text)
+                    and not self.DOCUMENT_MARKER_RE.search(text, first_key.start())):
+                metadata = yaml.dump({"annotations": annotations, "maintainers": maintainers},
+                                     Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
+                with open(chart_file, 'a') as f:
+                    f.write(metadata if text.endswith("\n") else "\n" + metadata)
+                return
+
+            chart_data = yaml.load(text, Loader=YAML_LOADER)
 
             # Add pattern-specific annotations
             if "annotations" not in chart_data:
                 chart_data["annotations"] = {}
 
-            chart_data["annotations"]["validatedpatterns.io/pattern"] = self.generator.pattern_name
-            chart_data["annotations"]["validatedpatterns.io/migrated"] = "true"
+            chart_data["annotations"].update(annotations)
 
             # Update maintainers if not present
             if "maintainers" not in chart_data or not chart_data["maintainers"]:
-                chart_data["maintainers"] = [{
-                    "name": "Validated Patterns Team",
-                    "email": "validated-patterns@redhat.com"
-                }]
+                chart_data["maintainers"] = maintainers
 
             with open(chart_file, 'w') as f:
-                yaml.dump(chart_data, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(chart_data, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
         except Exception as e:
             log_warn(f"    Could not update chart metadata: {e}")
@@ -175,29 +322,19 @@ class HelmMigrator:
     def _identify_useful_scripts(self, scripts: List[Path]) -> List[Path]:
         """Identify scripts that might be useful in the pattern."""
         useful_scripts = []
-        useful_patterns = [
-            "deploy", "install", "setup", "test", "validate",
-            "build", "push", "release", "backup", "restore"
-        ]
-
-        exclude_patterns = [
-            "node_modules", "venv", ".git", "vendor",
-            "__pycache__", ".pytest_cache"
-        ]
 
         for script in scripts:
             # Skip if in excluded directory
-            if any(pattern in str(script) for pattern in exclude_patterns):
+            if self.EXCLUDED_SCRIPT_PATH_RE.search(str(script)):
                 continue
 
             # Include if name matches useful patterns
-            script_name_lower = script.name.lower()
-            if any(pattern in script_name_lower for pattern in useful_patterns):
+            if self.USEFUL_SCRIPT_NAME_RE.search(script.name.lower()):
                 useful_scripts.append(script)
                 continue
 
             # Include if it's in a scripts or bin directory
-            if script.parent.name in ["scripts", "bin", "tools"]:
+            if script.parent.name in self.SCRIPT_DIRECTORY_NAMES:
                 useful_scripts.append(script)
 
         return useful_scripts
@@ -213,12 +350,19 @@ class HelmMigrator:
         }
 
         # Count migrated charts
-        if self.migrated_dir.exists():
-            summary["migrated_charts"] = len(list(self.migrated_dir.glob("*/")))
+        summary["migrated_charts"] = _count_subdirs(self.migrated_dir)
 
         # Count wrapper charts
         hub_charts_dir = self.pattern_dir / "charts" / "hub"
-        if hub_charts_dir.exists():
-            summary["wrapper_charts_created"] = len(list(hub_charts_dir.glob("*/")))
+        summary["wrapper_charts_created"] = _count_subdirs(hub_charts_dir)
+
+        return summary
+
 
-        return summary
\ No newline at end of file
+def _count_subdirs(directory: Path) -> int:
+    """Count the subdirectories of directory; 0 if it is not a directory."""
+    try:
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
@@ -4,12 +4,19 @@ Data models for validated pattern converter.
 This module contains shared dataclasses used across the converter.
 """
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Set
 
+# Keyword arguments for @dataclass that drop the per-instance __dict__ where
+# supported (slots=True needs Python 3.10+; older versions keep the default).
+# The models below use it; those never changed after construction are also
+# frozen.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class HelmChart:
     """Represents a Helm chart found in the repository."""
     name: str
@@ -28,7 +35,7 @@ class HelmChart:
     makefile_analysis: Optional[Any] = None  # Will be MakefileAnalysis when available
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProductVersion:
     """Represents a product version detected in the pattern."""
     name: str
@@ -38,7 +45,7 @@ class ProductVersion:
     operator_info: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ArchitecturePattern:
     """Represents a detected architecture pattern."""
     name: str
@@ -47,7 +54,7 @@ class ArchitecturePattern:
     description: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ClusterGroupApplication:
     """Application definition for ClusterGroup"""
     name: str
@@ -59,7 +66,7 @@ class ClusterGroupApplication:
     overrides: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ClusterGroupSubscription:
     """Subscription definition for ClusterGroup"""
     name: str
@@ -69,14 +76,14 @@ class ClusterGroupSubscription:
     source_namespace: str = "openshift-marketplace"
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ManagedClusterGroup:
     """Managed cluster group definition"""
     name: str
     labels: List[Dict[str, str]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ClusterGroupData:
     """ClusterGroup configuration data"""
     name: str
@@ -88,7 +95,7 @@ class ClusterGroupData:
     managed_cluster_groups: List[ManagedClusterGroup] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PatternData:
     """Complete pattern data for generation"""
     name: str
@@ -105,9 +112,13 @@ class PatternData:
     cluster_group_data: Optional[ClusterGroupData] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AnalysisResult:
-    """Results from repository analysis."""
+    """Results from repository analysis.
+
+    Chart paths and file lists come from walking source_path, so they refer
+    to entries that existed at analysis time; consumers need not re-check.
+    """
     source_path: Path
     helm_charts: List[HelmChart] = field(default_factory=list)
     yaml_files: List[Path] = field(default_factory=list)
@@ -9,26 +9,217 @@ This module automatically generates appropriate configurations based on detected
 - Data Processing: Pipeline orchestration, storage optimization
 """
 
+import copy
 from dataclasses import dataclass
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import yaml
 
 from .models import AnalysisResult
-from .utils import log_info, console
+from .utils import log_info, console, YAML_LOADER, YAML_DUMPER
 from .rules_engine import PatternDefinition, load_patterns
 
 
 @dataclass
 class PatternConfig:
     """Configuration for a specific pattern type."""
-    namespaces: List[str]
+    namespaces: Tuple[str, ...]
     subscriptions: Dict[str, Dict[str, Any]]
     applications: Dict[str, Dict[str, Any]]
     resources: Dict[str, Any]
     policies: Dict[str, Any]
 
 
+# Configurations that do not depend on pattern evidence are built once at
+# import and shared; treat them as read-only. apply_to_values copies what it
+# takes from a config into the values tree.
+_MLOPS_CONFIG = PatternConfig(
+    namespaces=(
+        "mlflow",
+        "kserve",
+        "model-experiments",
+    ),
+    subscriptions={
+        "kserve": {
+            "namespace": "kserve",
+            "channel": "stable",
+            "source": "community-operators",
+            "description": "Model serving and inference"
+        }
+    },
+    applications={
+        "mlflow": {
+            "name": "mlflow",
+            "namespace": "mlflow",
+            "description": "Model lifecycle management",
+            "helm": {
+                "values": {
+                    "backend": {
+                        "store": "postgres",
+                        "artifactStore": "s3"
+                    }
+                }
+            }
+        },
+        "model-registry": {
+            "name": "model-registry",
+            "namespace": "model-experiments",
+            "description": "Central model registry"
+        }
+    },
+    resources={
+        "experiment_tracking": {
+            "enabled": True,
+            "storage": "100Gi"
+        },
+        "model_versioning": {
+            "enabled": True,
+            "retention": "30d"
+        },
+        "ab_testing": {
+            "enabled": True,
+            "traffic_split": {
+                "canary": 10,
+                "stable": 90
+            }
+        }
+    },
+    policies={
+        "deployment_strategy": {
+            "type": "canary",
+            "rollback_on_failure": True,
+            "metrics_analysis": True
+        }
+    }
+)
+
+
+_MCP_CONFIG = PatternConfig(
+    namespaces=(
+        "mcp-servers",
+        "tool-registry",
+    ),
+    subscriptions={},
+    applications={
+        "mcp-server": {
+            "name": "mcp-server",
+            "namespace": "mcp-servers",
+            "description": "Model Context Protocol server",
+            "helm": {
+                "values": {
+                    "tools": {
+                        "enabled": True,
+                        "registry": "tool-registry"
+                    },
+                    "api": {
+                        "rateLimit": {
+                            "enabled": True,
+                            "requests_per_minute": 100
+                        }
+                    }
+                }
+            }
+        }
+    },
+    resources={
+        "api_keys": {
+            "vault_path": "/secret/mcp/api-keys",
+            "rotation": "30d"
+        },
+        "tool_permissions": {
+            "default": "read",
+            "admin": ["read", "write", "execute"]
+        }
+    },
+    policies={
+        "circuit_breaker": {
+            "enabled": True,
+            "failure_threshold": 5,
+            "timeout": "30s"
+        }
+    }
+)
+
+
+_SCALING_CONFIG = PatternConfig(
+    namespaces=(
+        "keda",
+        "prometheus",
+        "grafana",
+    ),
+    subscriptions={
+        "keda": {
+            "namespace": "keda",
+            "channel": "stable",
+            "source": "community-operators",
+            "description": "Kubernetes Event-driven Autoscaling"
+        },
+        "prometheus": {
+            "namespace": "prometheus",
+            "channel": "stable",
+            "source": "community-operators",
+            "description": "Metrics collection for autoscaling"
+        }
+    },
+    applications={
+        "keda": {
+            "name": "keda",
+            "namespace": "keda",
+            "description": "Event-driven autoscaler"
+        },
+        "prometheus": {
+            "name": "prometheus",
+            "namespace": "prometheus",
+            "description": "Metrics server"
+        },
+        "grafana": {
+            "name": "grafana",
+            "namespace": "grafana",
+            "description": "Metrics visualization",
+            "helm": {
+                "values": {
+                    "dashboards": {
+                        "default": {
+                            "cluster-autoscaler": True,
+                            "hpa-metrics": True,
+                            "resource-usage": True
+                        }
+                    }
+                }
+            }
+        }
+    },
+    resources={
+        "cluster_autoscaler": {
+            "enabled": True,
+            "min_nodes": 3,
+            "max_nodes": 100,
+            "scale_down_delay": "10m"
+        },
+        "resource_quotas": {
+            "enabled": True,
+            "per_namespace": True
+        }
+    },
+    policies={
+        "hpa": {
+            "cpu_threshold": 70,
+            "memory_threshold": 80,
+            "scale_up_rate": "100%",
+            "scale_down_rate": "10%"
+        },
+        "vpa": {
+            "enabled": True,
+            "update_mode": "Auto"
+        },
+        "pdb": {
+            "min_available": "50%",
+            "description": "Pod Disruption Budget for HA"
+        }
+    }
+)
+
+
 class PatternConfigurator:
     """Generates pattern-specific configurations."""
 
@@ -36,38 +227,35 @@ class PatternConfigurator:
         self.analysis = analysis_result
         self.detected_patterns = []
         self.pattern_definitions = load_patterns()
-        self.pattern_evidence = {}  # Store evidence for each detected pattern
+        self.pattern_evidence: Dict[str, List[str]] = {}  # Store evidence for each detected pattern
 
-        # Extract pattern names with high confidence (>= 0.6)
+        # Extract pattern names with high confidence (>= 0.6), once each in
+        # detection order; pattern_evidence doubles as the membership set
         if hasattr(analysis_result, 'enhanced_analysis') and analysis_result.enhanced_analysis:
             for chart_analysis in analysis_result.enhanced_analysis:
                 for pattern in chart_analysis.patterns:
                     if pattern.confidence >= 0.6:
-                        self.detected_patterns.append(pattern.name)
+                        if pattern.name not in self.pattern_evidence:
+                            self.detected_patterns.append(pattern.name)
                         self.pattern_evidence[pattern.name] = pattern.evidence
 
     def generate_configurations(self) -> Dict[str, PatternConfig]:
         """Generate configurations for all detected patterns."""
         configs = {}
 
-        # Map pattern names to configuration generators
-        pattern_config_map = {
-            "AI/ML Pipeline": self._generate_ai_ml_config,
-            "Security Patterns": self._generate_security_config,
-            "Scaling & Performance": self._generate_scaling_config,
-            "Data Processing Workflow": self._generate_data_processing_config,
-            "MLOps Operations": self._generate_mlops_config,
-            "Model Context Protocol": self._generate_mcp_config,
-        }
+        # First definition wins, as with a linear search
+        definitions_by_name: Dict[str, PatternDefinition] = {}
+        for definition in self.pattern_definitions:
+            definitions_by_name.setdefault(definition.name, definition)
 
         for pattern_name in self.detected_patterns:
-            config_generator = pattern_config_map.get(pattern_name)
-            if config_generator:
-                config_key = pattern_name.lower().replace(" ", "_").replace("&", "and")
-                configs[config_key] = config_generator()
+            dispatch = self._PATTERN_DISPATCH.get(pattern_name)
+            if dispatch:
+                config_key, config_generator = dispatch
+                configs[config_key] = config_generator(self)
 
                 # Add recommendations from pattern definition
-                pattern_def = next((p for p in self.pattern_definitions if p.name == pattern_name), None)
+                pattern_def = definitions_by_name.get(pattern_name)
                 if pattern_def and pattern_def.recommendations:
                     log_info(f"  Recommendations for {pattern_name}:")
                     for rec in pattern_def.recommendations:
@@ -87,10 +275,10 @@ class PatternConfigurator:
         has_llm = any("llm" in e.lower() or "model" in e.lower() for e in evidence)
 
         config = PatternConfig(
-            namespaces=[
+            namespaces=(
                 "ai-ml-serving",
                 "model-registry",
-            ],
+            ),
             subscriptions={},
             applications={},
             resources={},
@@ -99,7 +287,7 @@ class PatternConfigurator:
 
         # Add GPU operator if GPU resources detected
         if has_gpu:
-            config.namespaces.append("gpu-operator")
+            config.namespaces += ("gpu-operator",)
             config.subscriptions["gpu-operator"] = {
                 "namespace": "gpu-operator",
                 "channel": "stable",
@@ -117,7 +305,7 @@ class PatternConfigurator:
 
         # Add Red Hat OpenShift AI for comprehensive ML workflows
         if has_llm or has_rag:
-            config.namespaces.append("rhoai")
+            config.namespaces += ("rhoai",)
             config.subscriptions["rhoai"] = {
                 "namespace": "rhoai",
                 "channel": "stable",
@@ -172,115 +360,13 @@ class PatternConfigurator:
         """Generate MLOps specific configuration."""
         log_info("Generating MLOps pattern configuration...")
 
-        return PatternConfig(
-            namespaces=[
-                "mlflow",
-                "kserve",
-                "model-experiments"
-            ],
-            subscriptions={
-                "kserve": {
-                    "namespace": "kserve",
-                    "channel": "stable",
-                    "source": "community-operators",
-                    "description": "Model serving and inference"
-                }
-            },
-            applications={
-                "mlflow": {
-                    "name": "mlflow",
-                    "namespace": "mlflow",
-                    "description": "Model lifecycle management",
-                    "helm": {
-                        "values": {
-                            "backend": {
-                                "store": "postgres",
-                                "artifactStore": "s3"
-                            }
-                        }
-                    }
-                },
-                "model-registry": {
-                    "name": "model-registry",
-                    "namespace": "model-experiments",
-                    "description": "Central model registry"
-                }
-            },
-            resources={
-                "experiment_tracking": {
-                    "enabled": True,
-                    "storage": "100Gi"
-                },
-                "model_versioning": {
-                    "enabled": True,
-                    "retention": "30d"
-                },
-                "ab_testing": {
-                    "enabled": True,
-                    "traffic_split": {
-                        "canary": 10,
-                        "stable": 90
-                    }
-                }
-            },
-            policies={
-                "deployment_strategy": {
-                    "type": "canary",
-                    "rollback_on_failure": True,
-                    "metrics_analysis": True
-                }
-            }
-        )
+        return _MLOPS_CONFIG
 
     def _generate_mcp_config(self) -> PatternConfig:
         """Generate Model Context Protocol specific configuration."""
         log_info("Generating MCP pattern configuration...")
 
-        return PatternConfig(
-            namespaces=[
-                "mcp-servers",
-                "tool-registry"
-            ],
-            subscriptions={},
-            applications={
-                "mcp-server": {
-                    "name": "mcp-server",
-                    "namespace": "mcp-servers",
-                    "description": "Model Context Protocol server",
-                    "helm": {
-                        "values": {
-                            "tools": {
-                                "enabled": True,
-                                "registry": "tool-registry"
-                            },
-                            "api": {
-                                "rateLimit": {
-                                    "enabled": True,
-                                    "requests_per_minute": 100
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            resources={
-                "api_keys": {
-                    "vault_path": "/secret/mcp/api-keys",
-                    "rotation": "30d"
-                },
-                "tool_permissions": {
-                    "default": "read",
-                    "admin": ["read", "write", "execute"]
-                }
-            },
-            policies={
-                "circuit_breaker": {
-                    "enabled": True,
-                    "failure_threshold": 5,
-                    "timeout": "30s"
-                }
-            }
-        )
+        return _MCP_CONFIG
 
     def _generate_security_config(self) -> PatternConfig:
         """Generate security-specific configuration."""
@@ -293,7 +379,7 @@ class PatternConfigurator:
         has_rbac = any("rbac" in e.lower() for e in evidence)
 
         config = PatternConfig(
-            namespaces=[],
+            namespaces=(),
             subscriptions={},
             applications={},
             resources={
@@ -322,7 +408,7 @@ class PatternConfigurator:
 
         # Add Vault if secrets management detected
         if has_vault:
-            config.namespaces.append("vault")
+            config.namespaces += ("vault",)
             config.applications["vault"] = {
                 "name": "vault",
                 "namespace": "vault",
@@ -334,7 +420,7 @@ class PatternConfigurator:
 
         # Add cert-manager if TLS/certificates detected
         if has_cert_manager:
-            config.namespaces.append("cert-manager")
+            config.namespaces += ("cert-manager",)
             config.subscriptions["cert-manager"] = {
                 "namespace": "cert-manager",
                 "channel": "stable",
@@ -351,7 +437,7 @@ class PatternConfigurator:
             }
 
         # Always include security operators for patterns
-        config.namespaces.extend(["compliance-operator", "stackrox"])
+        config.namespaces += ("compliance-operator", "stackrox")
         config.subscriptions.update({
             "compliance-operator": {
                 "namespace": "compliance-operator",
@@ -379,83 +465,7 @@ class PatternConfigurator:
         """Generate scaling-specific configuration."""
         log_info("Generating scaling pattern configuration...")
 
-        return PatternConfig(
-            namespaces=[
-                "keda",
-                "prometheus",
-                "grafana"
-            ],
-            subscriptions={
-                "keda": {
-                    "namespace": "keda",
-                    "channel": "stable",
-                    "source": "community-operators",
-                    "description": "Kubernetes Event-driven Autoscaling"
-                },
-                "prometheus": {
-                    "namespace": "prometheus",
-                    "channel": "stable",
-                    "source": "community-operators",
-                    "description": "Metrics collection for autoscaling"
-                }
-            },
-            applications={
-                "keda": {
-                    "name": "keda",
-                    "namespace": "keda",
-                    "description": "Event-driven autoscaler"
-                },
-                "prometheus": {
-                    "name": "prometheus",
-                    "namespace": "prometheus",
-                    "description": "Metrics server"
-                },
-                "grafana": {
-                    "name": "grafana",
-                    "namespace": "grafana",
-                    "description": "Metrics visualization",
-                    "helm": {
-                        "values": {
-                            "dashboards": {
-                                "default": {
-                                    "cluster-autoscaler": True,
-                                    "hpa-metrics": True,
-                                    "resource-usage": True
-                                }
-                            }
-                        }
-                    }
-                }
-            },
-            resources={
-                "cluster_autoscaler": {
-                    "enabled": True,
-                    "min_nodes": 3,
-                    "max_nodes": 100,
-                    "scale_down_delay": "10m"
-                },
-                "resource_quotas": {
-                    "enabled": True,
-                    "per_namespace": True
-                }
-            },
-            policies={
-                "hpa": {
-                    "cpu_threshold": 70,
-                    "memory_threshold": 80,
-                    "scale_up_rate": "100%",
-                    "scale_down_rate": "10%"
-                },
-                "vpa": {
-                    "enabled": True,
-                    "update_mode": "Auto"
-                },
-                "pdb": {
-                    "min_available": "50%",
-                    "description": "Pod Disruption Budget for HA"
-                }
-            }
-        )
+        return _SCALING_CONFIG
 
     def _generate_data_processing_config(self) -> PatternConfig:
         """Generate data processing specific configuration."""
@@ -468,10 +478,10 @@ class PatternConfigurator:
         has_airflow = any("airflow" in e.lower() for e in evidence)
 
         config = PatternConfig(
-            namespaces=[
+            namespaces=(
                 "data-pipeline",
-                "streaming"
-            ],
+                "streaming",
+            ),
             subscriptions={},
             applications={},
             resources={
@@ -509,7 +519,7 @@ class PatternConfigurator:
 
         # Add Kafka operator if streaming detected
         if has_kafka:
-            config.namespaces.append("kafka")
+            config.namespaces += ("kafka",)
             config.subscriptions["strimzi-kafka-operator"] = {
                 "namespace": "kafka",
                 "channel": "stable",
@@ -524,7 +534,7 @@ class PatternConfigurator:
 
         # Add Spark operator if Spark detected
         if has_spark:
-            config.namespaces.append("spark")
+            config.namespaces += ("spark",)
             config.subscriptions["spark-operator"] = {
                 "namespace": "spark",
                 "channel": "stable",
@@ -611,56 +621,61 @@ class PatternConfigurator:
 
         return resources
 
-    def apply_to_values(self, values_file: Path, pattern_configs: Dict[str, PatternConfig]) -> None:
-        """Apply pattern configurations to values file."""
+    def apply_to_values(self, values_file: Path, pattern_configs: Dict[str, PatternConfig],
+                        values: Optional[Dict[str, Any]] = None) -> None:
+        """Apply pattern configurations to values file.
+
+        values, if given, is the file's already-parsed content and is
+        updated in place instead of reading the file.
+        """
         log_info(f"Applying pattern configurations to {values_file}")
 
         # Load existing values
-        values = {}
-        if values_file.exists():
-            with open(values_file, 'r') as f:
-                values = yaml.safe_load(f) or {}
+        if values is None:
+            values = {}
+            if values_file.exists():
+                with open(values_file, 'rb') as f:
+                    values = yaml.load(f, Loader=YAML_LOADER) or {}
 
         # Apply configurations
-        for pattern_name, config in pattern_configs.items():
-            log_info(f"  Applying {pattern_name} configuration...")
-
-            # Add namespaces
-            if 'clusterGroup' not in values:
-                values['clusterGroup'] = {}
-            if 'namespaces' not in values['clusterGroup']:
-                values['clusterGroup']['namespaces'] = []
-
-            for ns in config.namespaces:
-                if ns not in values['clusterGroup']['namespaces']:
-                    values['clusterGroup']['namespaces'].append(ns)
-
-            # Add subscriptions
-            if 'subscriptions' not in values['clusterGroup']:
-                values['clusterGroup']['subscriptions'] = {}
-
-            values['clusterGroup']['subscriptions'].update(config.subscriptions)
-
-            # Add applications
-            if 'applications' not in values['clusterGroup']:
-                values['clusterGroup']['applications'] = {}
-
-            values['clusterGroup']['applications'].update(config.applications)
-
-        # Write updated values
-        with open(values_file, 'w') as f:
-            yaml.dump(values, f, default_flow_style=False, sort_keys=False)
+        if pattern_configs:
+            cluster_group = values.setdefault('clusterGroup', {})
+            namespaces = cluster_group.setdefault('namespaces', [])
+            subscriptions = cluster_group.setdefault('subscriptions', {})
+            applications = cluster_group.setdefault('applications', {})
+            # Existing entries may also be mappings, which never equal a name
+            seen_namespaces = {ns for ns in namespaces if isinstance(ns, str)}
+
+            for pattern_name, config in pattern_configs.items():
+                log_info(f"  Applying {pattern_name} configuration...")
+
+                # Add namespaces
+                for ns in config.namespaces:
+                    if ns not in seen_namespaces:
+                        namespaces.append(ns)
+                        seen_namespaces.add(ns)
+
+                # Add subscriptions and applications as copies, so later
+                # edits of the values tree cannot reach a shared config
+                subscriptions.update(copy.deepcopy(config.subscriptions))
+
+                applications.update(copy.deepcopy(config.applications))
+
+        # Write updated values; the emitter encodes UTF-8 itself
+        with open(values_file, 'wb') as f:
+            yaml.dump(values, f, Dumper=YAML_DUMPER, default_flow_style=False, sort_keys=False,
+                      encoding='utf-8')
 
         log_info(f"  Updated {values_file} with pattern-specific configurations")
 
     def generate_resource_files(self, output_dir: Path, pattern_configs: Dict[str, PatternConfig]) -> None:
         """Generate resource-specific YAML files for each pattern."""
         resources_dir = output_dir / "resources"
-        resources_dir.mkdir(exist_ok=True)
 
         for pattern_name, config in pattern_configs.items():
+            # Creates resources/ along with the first pattern directory
             pattern_dir = resources_dir / pattern_name
-            pattern_dir.mkdir(exist_ok=True)
+            pattern_dir.mkdir(parents=True, exist_ok=True)
 
             # Generate HPA configurations for AI/ML and scaling patterns
             if pattern_name in ["ai_ml", "scaling"] and "hpa" in config.policies:
@@ -710,8 +725,8 @@ class PatternConfigurator:
                 }
             })
 
-        with open(hpa_file, 'w') as f:
-            yaml.dump(hpa_config, f, default_flow_style=False)
+        with open(hpa_file, 'wb') as f:
+            yaml.dump(hpa_config, f, Dumper=YAML_DUMPER, default_flow_style=False, encoding='utf-8')
 
         log_info(f"    Generated HPA configuration: {hpa_file}")
 
@@ -762,8 +777,8 @@ class PatternConfigurator:
                 }
             })
 
-        with open(np_file, 'w') as f:
-            yaml.dump_all(policies, f, default_flow_style=False)
+        with open(np_file, 'wb') as f:
+            yaml.dump_all(policies, f, Dumper=YAML_DUMPER, default_flow_style=False, encoding='utf-8')
 
         log_info(f"    Generated network policies: {np_file}")
 
@@ -783,12 +798,28 @@ class PatternConfigurator:
             }
         }
 
-        with open(rq_file, 'w') as f:
-            yaml.dump(quota_config, f, default_flow_style=False)
+        with open(rq_file, 'wb') as f:
+            yaml.dump(quota_config, f, Dumper=YAML_DUMPER, default_flow_style=False, encoding='utf-8')
 
         log_info(f"    Generated resource quota: {rq_file}")
 
     def _update_report_with_patterns(self, pattern_configs: Dict[str, Any]) -> None:
         """Update conversion report with pattern-specific information."""
         # Implementation remains the same
-        pass
\ No newline at end of file
+        pass
+
+    # Map pattern names to configuration generators
+    _PATTERN_GENERATORS = {
+        "AI/ML Pipeline": _generate_ai_ml_config,
+        "Security Patterns": _generate_security_config,
+        "Scaling & Performance": _generate_scaling_config,
+        "Data Processing Workflow": _generate_data_processing_config,
+        "MLOps Operations": _generate_mlops_config,
+        "Model Context Protocol": _generate_mcp_config,
+    }
+
+    # Pattern name -> (config key, generator), with the keys derived once
+    _PATTERN_DISPATCH = {
+        name: (name.lower().replace(" ", "_").replace("&", "and"), generator)
+        for name, generator in _PATTERN_GENERATORS.items()
+    }
@@ -5,10 +5,11 @@ Product detection module for extracting product information from Helm charts and
 import re
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
 from .models import ProductVersion, AnalysisResult
+from .utils import YAML_LOADER
 
 @dataclass
 class DetectedProduct:
@@ -154,6 +155,12 @@ class ProductDetector:
 
     def __init__(self):
         self.detected_products: Dict[str, DetectedProduct] = {}
+        # Per-file results keyed on (path, mtime_ns); chart directories and
+        # the YAML files inside them are often both scanned
+        self._file_cache: Dict[Tuple[Path, int], List[DetectedProduct]] = {}
+        # Parsed documents keyed the same way, shared by detect_from_path and
+        # detect_product_versions so each file is read and parsed once
+        self._document_cache: Dict[Tuple[Path, int], List[Any]] = {}
 
     def detect_from_path(self, path: Path) -> List[DetectedProduct]:
         """Detect products from a given path (file or directory)."""
@@ -169,14 +176,47 @@ class ProductDetector:
         return []
 
     def _detect_from_file(self, file_path: Path) -> List[DetectedProduct]:
-        """Detect products from a single YAML file."""
-        products = []
+        """Detect products from a single YAML file, parsing it at most once."""
+        try:
+            key = (file_path, file_path.stat().st_mtime_ns)
+        except OSError:
+            return []
+
+        cached = self._file_cache.get(key)
+        if cached is None:
+            cached = self._parse_file(file_path)
+            self._file_cache[key] = cached
+        return list(cached)
+
+    def _load_documents(self, file_path: Path) -> List[Any]:
+        """Load the YAML documents of a file, cached on (path, mtime_ns).
+
+        Documents before a parse error are kept, matching how the scans
+        handled a failing multi-document stream.
+        """
         try:
-            with open(file_path, 'r') as f:
-                content = f.read()
+            key = (file_path, file_path.stat().st_mtime_ns)
+        except OSError:
+            return []
+
+        documents = self._document_cache.get(key)
+        if documents is None:
+            documents = []
+            try:
+                with open(file_path, 'rb') as f:
+                    for doc in yaml.load_all(f, Loader=YAML_LOADER):
+                        documents.append(doc)
+            except Exception:
+                pass
+            self._document_cache[key] = documents
+        return documents
 
+    def _parse_file(self, file_path: Path) -> List[DetectedProduct]:
+        """Extract the products referenced by a YAML file."""
+        products = []
+        try:
             # Handle multi-document YAML
-            for doc in yaml.safe_load_all(content):
+            for doc in self._load_documents(file_path):
                 if not doc:
                     continue
 
@@ -488,10 +528,7 @@ class ProductDetector:
         # Check YAML files for Subscription and CSV resources
         for yaml_file in analysis_result.yaml_files:
             try:
-                with open(yaml_file, 'r') as f:
-                    content = f.read()
-                
-                for doc in yaml.safe_load_all(content):
+                for doc in self._load_documents(yaml_file):
                     if not doc:
                         continue
                     
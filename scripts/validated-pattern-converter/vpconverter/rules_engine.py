@@ -6,12 +6,15 @@ architecture patterns in Helm charts and Kubernetes configurations.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Pattern, Tuple, Union
 import re
 from pathlib import Path
 
 from .models import ArchitecturePattern
 
+# Match modes whose values are plain substrings and can share a single scan
+SUBSTRING_MODES = ("contains", "any_of")
+
 
 @dataclass
 class DetectionRule:
@@ -369,6 +372,41 @@ DEFAULT_PATTERNS = [
 ]
 
 
+def rule_group_key(rule: DetectionRule) -> Tuple[str, str, bool]:
+    """Key under which sibling rules are fused into one alternation."""
+    return (rule.type, rule.match_mode, rule.case_sensitive)
+
+
+def compile_rule_groups(patterns: List[PatternDefinition]) -> Dict[Tuple[str, str, bool], Pattern[str]]:
+    """Fuse substring rules sharing type, match mode and case sensitivity.
+
+    Each combined pattern is a prefilter: a text it does not match cannot
+    satisfy any rule in its group, so per-rule matching can be skipped.
+    Texts must be lowercased before searching a case-insensitive group.
+    """
+    values_by_group: Dict[Tuple[str, str, bool], List[str]] = {}
+    unfusable = set()
+
+    for pattern_def in patterns:
+        for rule in pattern_def.rules:
+            if rule.match_mode not in SUBSTRING_MODES:
+                continue
+            key = rule_group_key(rule)
+            values = [rule.match_value] if isinstance(rule.match_value, str) else rule.match_value
+            if not all(isinstance(v, str) for v in values):
+                unfusable.add(key)
+                continue
+            if not rule.case_sensitive:
+                values = [v.lower() for v in values]
+            values_by_group.setdefault(key, []).extend(values)
+
+    return {
+        key: re.compile('|'.join(re.escape(v) for v in dict.fromkeys(values)))
+        for key, values in values_by_group.items()
+        if key not in unfusable
+    }
+
+
 def load_patterns(pattern_file: Optional[Path] = None) -> List[PatternDefinition]:
     """Load pattern definitions from file or use defaults"""
     if pattern_file and pattern_file.exists():
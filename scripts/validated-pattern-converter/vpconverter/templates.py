@@ -596,7 +596,7 @@ clusterGroup:
       enabled: true
       chart: {{ chart_name }}
       repoURL: https://charts.example.com  # TODO: Update
-      targetRevision: {{ chart_version or "1.0.0" }}  # TODO: Update
+      targetRevision: {{ target_revision }}  # TODO: Update
       valuesFile: values-hub-{{ chart_name }}.yaml
 
 global:
@@ -605,6 +605,20 @@ global:
   namespace: {{ chart_name }}
 """
 
+# Wrapper chart namespace template
+# Rendering drops one trailing newline, hence the blank last line
+WRAPPER_NAMESPACE_TEMPLATE = """\
+apiVersion: v1
+kind: Namespace
+metadata:
+  name: {{ chart_name }}
+  labels:
+    argocd.argoproj.io/managed-by: openshift-gitops
+  annotations:
+    argocd.argoproj.io/sync-wave: "100"
+
+"""
+
 # ArgoCD Application template
 ARGOCD_APPLICATION_TEMPLATE = """\
 # ArgoCD Applications are now managed by the ClusterGroup chart
@@ -973,4 +987,10 @@ spec:
           configMap:
             name: {{ job_name }}-playbooks
             defaultMode: 0755
-"""
\ No newline at end of file
+"""
+
+# Every template above by constant name, for the generator's template loader
+TEMPLATES = {
+    name: value for name, value in list(globals().items())
+    if name.endswith("_TEMPLATE") and isinstance(value, str)
+}
@@ -2,29 +2,50 @@
 Utility functions for the validated pattern converter.
 """
 
+import fnmatch
+import functools
 import logging
 import os
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, Iterator, List, Dict, Any, Tuple, Union, TYPE_CHECKING
 from contextlib import contextmanager
 
-import git
 import yaml
 from rich.console import Console
 from rich.logging import RichHandler
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 from .config import COLORS, LOGGING_CONFIG
 
+# GitPython and rich.progress are slow to import and only needed by
+# clone_repository and create_progress_bar, so they are imported there
+if TYPE_CHECKING:
+    import git
+    from rich.progress import Progress
+    from rich.status import Status
+
 
 # Initialize Rich console for pretty output
 console = Console()
 
+# Prefer the libyaml-backed safe loader/dumper when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# On-disk analysis caches live here. Setting VPCONVERTER_NO_CACHE to a
+# non-empty value turns them off.
+CACHE_ROOT = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser() / "vpconverter"
+
+# Cache files not read or written for this many seconds are deleted
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
 
 def setup_logging(verbose: bool = False) -> logging.Logger:
     """Set up logging configuration with Rich handler."""
@@ -40,24 +61,82 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
     return logging.getLogger("vpconverter")
 
 
+# Per-thread list that collects log lines inside buffered_logs()
+_log_buffer = threading.local()
+
+
+def _emit(markup: str) -> None:
+    """Print a log line, or collect it if this thread is buffering."""
+    lines = getattr(_log_buffer, "lines", None)
+    if lines is None:
+        console.print(markup)
+    else:
+        lines.append(markup)
+
+
 def log_info(message: str) -> None:
     """Log info message with green color."""
-    console.print(f"[green][INFO][/green] {message}")
+    _emit(f"[green][INFO][/green] {message}")
 
 
 def log_warn(message: str) -> None:
     """Log warning message with yellow color."""
-    console.print(f"[yellow][WARN][/yellow] {message}")
+    _emit(f"[yellow][WARN][/yellow] {message}")
 
 
 def log_error(message: str) -> None:
     """Log error message with red color."""
-    console.print(f"[red][ERROR][/red] {message}")
+    _emit(f"[red][ERROR][/red] {message}")
 
 
 def log_success(message: str) -> None:
     """Log success message with bold green color."""
-    console.print(f"[bold green]✓[/bold green] {message}")
+    _emit(f"[bold green]✓[/bold green] {message}")
+
+
+@contextmanager
+def buffered_logs() -> Iterator[List[str]]:
+    """Context manager that collects this thread's log lines.
+
+    Yields the list the lines are collected in; print them later with
+    print_logs(), so work run on a thread pool logs in one write and in a
+    deterministic order.
+    """
+    previous = getattr(_log_buffer, "lines", None)
+    lines: List[str] = []
+    _log_buffer.lines = lines
+    try:
+        yield lines
+    finally:
+        _log_buffer.lines = previous
+
+
+def print_logs(lines: List[str]) -> None:
+    """Print log lines collected by buffered_logs() in one console write."""
+    if lines:
+        console.print("\n".join(lines))
+
+
+class _LoggedStatus:
+    """Stand-in for a Rich status that logs each update as a line."""
+
+    def update(self, status: str) -> None:
+        log_info(status)
+
+
+@contextmanager
+def progress_status(message: str) -> Iterator[Union["Status", _LoggedStatus]]:
+    """Context manager for a status spinner on interactive terminals.
+
+    The Rich spinner repaints from a background thread, which is wasted
+    work when output goes to a log (CI, pipes); there each update is
+    logged once instead.
+    """
+    if console.is_terminal and not os.environ.get("CI"):
+        with console.status(message) as status:
+            yield status
+    else:
+        yield _LoggedStatus()
 
 
 @contextmanager
@@ -70,8 +149,10 @@ def temporary_directory():
         shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-def clone_repository(url: str, target_dir: Path) -> git.Repo:
+def clone_repository(url: str, target_dir: Path) -> "git.Repo":
     """Clone a git repository to the specified directory."""
+    import git
+
     log_info(f"Cloning repository: {url}")
     try:
         repo = git.Repo.clone_from(url, target_dir)
@@ -91,27 +172,56 @@ def find_files(
     """Find files in directory matching pattern and/or extensions."""
     files = []
 
-    if recursive:
-        search_pattern = f"**/{pattern}" if pattern != "*" else "**/*"
+    candidates: Iterator[Path]
+    if "/" in pattern:
+        # Multi-component patterns are left to pathlib
+        search_pattern = f"**/{pattern}" if recursive else pattern
+        candidates = (path for path in directory.glob(search_pattern) if path.is_file())
     else:
-        search_pattern = pattern
-
-    for file_path in directory.glob(search_pattern):
-        if file_path.is_file():
-            if extensions:
-                if any(file_path.suffix == ext for ext in extensions):
-                    files.append(file_path)
-            else:
+        candidates = _scan_files(str(directory), pattern, recursive)
+
+    for file_path in candidates:
+        if extensions:
+            if any(file_path.suffix == ext for ext in extensions):
                 files.append(file_path)
+        else:
+            files.append(file_path)
 
     return sorted(files)
 
 
+def _scan_files(directory: str, pattern: str, recursive: bool) -> Iterator[Path]:
+    """Yield the files under directory whose names match pattern.
+
+    Walks with os.scandir so entry types come from the directory listing
+    instead of a stat() per path. Like Path.glob("**/..."), it skips
+    unreadable directories and does not descend into symlinked ones.
+    """
+    stack = [directory]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    if recursive and not entry.is_symlink():
+                        stack.append(entry.path)
+                    continue
+                is_file = entry.is_file()
+            except OSError:
+                continue
+            if is_file and fnmatch.fnmatch(entry.name, pattern):
+                yield Path(entry.path)
+
+
 def read_yaml(file_path: Path) -> Dict[str, Any]:
     """Read and parse a YAML file."""
     try:
         with open(file_path, 'r') as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=YAML_LOADER) or {}
     except yaml.YAMLError as e:
         log_error(f"Error parsing YAML file {file_path}: {e}")
         raise
@@ -125,8 +235,11 @@ def write_yaml(data: Dict[str, Any], file_path: Path) -> None:
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        with open(file_path, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        # Let the emitter produce UTF-8 directly instead of going through a
+        # text wrapper
+        with open(file_path, 'wb') as f:
+            yaml.dump(data, f, Dumper=YAML_DUMPER, default_flow_style=False,
+                      sort_keys=False, encoding='utf-8')
     except Exception as e:
         log_error(f"Error writing YAML file {file_path}: {e}")
         raise
@@ -138,12 +251,7 @@ def copy_tree(src: Path, dst: Path, ignore_patterns: Optional[List[str]] = None)
         ignore_patterns = []
 
     def ignore_function(directory, contents):
-        ignored = []
-        for pattern in ignore_patterns:
-            for item in contents:
-                if Path(item).match(pattern):
-                    ignored.append(item)
-        return ignored
+        return _ignored_names(contents, ignore_patterns)
 
     shutil.copytree(
         src, dst,
@@ -152,6 +260,58 @@ def copy_tree(src: Path, dst: Path, ignore_patterns: Optional[List[str]] = None)
     )
 
 
+def copy_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Copy a file with its metadata, like shutil.copy2.
+
+    Where os.copy_file_range exists (Linux) the data is copied inside the
+    kernel, which can share extents on copy-on-write filesystems. If that is
+    unavailable, fails or stops short of the source size, shutil.copy2
+    copies the file.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                # Empty-looking files (e.g. procfs) may still have content
+                copied_all = remaining > 0
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not copied:
+                        # The file shrank or the kernel gave up early
+                        copied_all = False
+                        break
+                    remaining -= copied
+            if copied_all:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            # e.g. EXDEV on older kernels or ENOSYS; copy2 starts over
+            pass
+    shutil.copy2(src, dst)
+
+
+def _ignored_names(names: List[str], ignore_patterns: List[str]) -> List[str]:
+    """Return the names that match any of the ignore patterns."""
+    if not ignore_patterns:
+        return []
+    if any("/" in pattern for pattern in ignore_patterns):
+        # Multi-component patterns keep pathlib's matching
+        return [item for item in names
+                if any(Path(item).match(pattern) for pattern in ignore_patterns)]
+    match = _ignore_regex(tuple(ignore_patterns)).match
+    return [item for item in names if match(item)]
+
+
+@functools.lru_cache(maxsize=None)
+def _ignore_regex(ignore_patterns: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile single-component glob patterns into one regex.
+
+    Case is ignored on Windows, as Path.match does there.
+    """
+    flags = re.IGNORECASE if sys.platform == "win32" else 0
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in ignore_patterns), flags)
+
+
 def run_command(
     command: List[str],
     cwd: Optional[Path] = None,
@@ -174,13 +334,19 @@ def run_command(
         raise
 
 
+@functools.lru_cache(maxsize=None)
 def check_command_exists(command: str) -> bool:
-    """Check if a command exists in the system PATH."""
+    """Check if a command exists in the system PATH.
+
+    The answer is cached per command for the life of the process.
+    """
     return shutil.which(command) is not None
 
 
-def create_progress_bar() -> Progress:
+def create_progress_bar() -> "Progress":
     """Create a Rich progress bar for long-running operations."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -202,6 +368,34 @@ def create_summary_table(title: str, data: List[tuple]) -> Table:
     return table
 
 
+def cache_enabled() -> bool:
+    """Return whether the on-disk analysis caches may be used."""
+    return not os.environ.get("VPCONVERTER_NO_CACHE")
+
+
+def touch_cache_file(cache_file: Path) -> None:
+    """Mark cache_file as used so prune_cache keeps it; failures are ignored."""
+    try:
+        os.utime(cache_file)
+    except OSError:
+        pass
+
+
+def prune_cache(cache_dir: Path, max_age: float = CACHE_MAX_AGE) -> None:
+    """Delete files in cache_dir not used for max_age seconds; failures are ignored."""
+    cutoff = time.time() - max_age
+    try:
+        entries = list(os.scandir(cache_dir))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file(follow_symlinks=False) and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
 def ensure_directory(path: Path) -> None:
     """Ensure a directory exists, creating it if necessary."""
     path.mkdir(parents=True, exist_ok=True)
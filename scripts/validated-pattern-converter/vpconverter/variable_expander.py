@@ -159,7 +159,12 @@ class VariableExpander:
             )
         
         result = VariableExpansion(original=text, expanded=text)
-        
+
+        # Every variable, automatic variable and function call starts with '$'
+        if '$' not in text:
+            self.expansion_cache[cache_key] = result
+            return result
+
         # Handle automatic variables first
         if target_name:
             result.expanded = self._expand_automatic_variables(